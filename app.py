@@ -1,45 +1,200 @@
-from flask import Flask, request, send_file, abort, jsonify
+from flask import Flask, Response, request, send_file, abort, jsonify, url_for
 import os
-import traceback
-from gen_map2 import generate_html_report
+import json
+import queue
+import base64
+import hashlib
+import logging
+import threading
+import time
+from urllib.parse import quote
+from gen_map2 import (REPORT_TAIL, collect_jobs, combine_location_counts, generate_html_report,
+                      iter_report_body, normalize_location, report_head)
+from render_pool import RenderTimeout, get_render_pool
+from gazetteer import GAZETTEER
+from health_checks import BrowserChecker
+from job_aggregates import JobAggregates
+from job_store import FIELDS, get_job_store
+from metrics import collect_timings, current_timings, exposition, resume_timings
+from naukri_scrape import get_driver_pool, iter_naukri_jobs
+from report_cache import ReportCache
+from report_jobs import QueueFull, ReportJobManager
+from search_index import get_search_index, warm_search_index
+
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+                    format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 
 app = Flask(__name__)
 
+# Per-request stage breakdown in a Server-Timing header: always, or with ?timing=1
+TIMING_HEADER = os.environ.get("TIMING_HEADER") == "1"
+
+@app.before_request
+def start_timings():
+    collect_timings(TIMING_HEADER or request.args.get("timing") == "1")
+
+@app.after_request
+def add_timing_header(response):
+    timings = current_timings()
+    if timings is not None and timings.totals:
+        response.headers["Server-Timing"] = timings.merge_header(response.headers.get("Server-Timing"))
+    return response
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics for this worker process"""
+    body, content_type = exposition()
+    return Response(body, content_type=content_type)
+
 @app.route('/')
 def home():
     return """
     <h2>Job Scraper API</h2>
     <p>Use <code>/jobs?role=Data Scientist</code> to get job report</p>
-    <p>Status: <a href="/health">Health Check</a></p>
+    <p>New reports are built in the background: poll the returned <code>/jobs/&lt;job_id&gt;</code> until it is done,
+       or add <code>&amp;stream=1</code> to receive the report as it is generated</p>
+    <p>Stored postings as JSON: <code>/jobs.json?role=Data Scientist&amp;location=Bangalore&amp;exp_min=2&amp;fields=title,url&amp;layout=columns</code></p>
+    <p>Several roles at once: <code>POST /jobs/batch</code> with <code>{"roles": [{"role": "Data Scientist", "pages": 3}, "PCB Design"]}</code>,
+       then poll <code>/jobs/batch/&lt;batch_id&gt;</code> for per-role reports and a combined location summary</p>
+    <p>Live results: <code>/jobs/stream?role=Data Scientist</code> sends each job and the running location counts as Server-Sent Events</p>
+    <p>Full-text search over every stored posting: <code>/search?q=python machine learning&amp;location=Pune</code></p>
+    <p>Location charts: <code>/jobs/&lt;role&gt;/map</code>, <code>/jobs/&lt;role&gt;/map.png</code>, <code>/jobs/&lt;role&gt;/chart.png?dpi=150</code></p>
+    <p>Status: <a href="/health/ready">Readiness</a> · <a href="/health/live">Liveness</a> · <a href="/metrics">Metrics</a>
+       (add <code>timing=1</code> to any request for a <code>Server-Timing</code> stage breakdown; background
+       reports list it under <code>timings</code>, streamed ones send it at the end)</p>
     """
 
+browser_checker = BrowserChecker(
+    get_driver_pool,
+    interval=float(os.environ.get("HEALTH_CHECK_INTERVAL", 60)),
+)
+
+@app.route('/health/live')
+def liveness():
+    """Liveness probe: the worker is up and serving requests"""
+    return jsonify({"status": "alive"})
+
 @app.route('/health')
-def health():
-    """Health check endpoint"""
-    try:
-        # Test if Chrome is available
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        
-        options = Options()
-        options.add_argument('--headless=new')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        
-        driver = webdriver.Chrome(options=options)
-        driver.quit()
-        
-        return jsonify({
-            "status": "healthy",
-            "chrome": "available",
-            "selenium": "working"
-        })
-    except Exception as e:
-        return jsonify({
-            "status": "unhealthy",
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }), 500
+@app.route('/health/ready')
+def readiness():
+    """Readiness probe from cached browser state and pool/queue saturation"""
+    browser_checker.start()
+    browser = browser_checker.result()
+    pool = get_driver_pool().stats()
+    pending = report_jobs.pending()
+
+    pool_full = pool["in_use"] >= pool["size"]
+    queue_full = pending >= report_jobs.max_queue
+    ready = browser["available"] is not False and not pool_full and not queue_full
+
+    return jsonify({
+        "status": "ready" if ready else "unavailable",
+        "browser": browser,
+        "pool": dict(pool, saturated=pool_full),
+        "queue": {"pending": pending, "limit": report_jobs.max_queue, "saturated": queue_full},
+    }), 200 if ready else 503
+
+MAX_PAGES = int(os.environ.get("MAX_PAGES", 10))
+CHART_DPI = int(os.environ.get("CHART_DPI", 150))
+MAX_CHART_DPI = 300
+CHART_MAX_AGE = int(os.environ.get("CHART_MAX_AGE", 3600))
+
+CHARTS = {
+    "map": ("Interactive India heatmap", "text/html"),
+    "map.png": ("Static India heatmap", "image/png"),
+    "chart.png": ("Top locations chart", "image/png"),
+}
+
+report_cache = ReportCache(
+    directory=os.environ.get("REPORT_CACHE_DIR", "report_cache"),
+    ttl=int(os.environ.get("REPORT_CACHE_TTL", 6 * 3600)),
+    max_entries=int(os.environ.get("REPORT_CACHE_MAX_ENTRIES", 100)),
+    max_bytes=int(os.environ.get("REPORT_CACHE_MAX_BYTES", 200 * 1024 * 1024)),
+)
+
+def _run_report(job_title, pages, progress):
+    key = report_cache.key(job_title, pages)
+    with report_cache.lock(key):
+        # Another worker may have finished this report while we waited
+        cached = report_cache.get(key)
+        if cached:
+            return cached
+        with report_cache.writing(key) as tmp_path, \
+                report_cache.writing(key, ".locations.json") as tmp_locations:
+            # Charts are rendered lazily by their own endpoints
+            result = generate_html_report(job_title=job_title, pages=pages, create_heatmap=False,
+                                          progress=progress, output_file=tmp_path,
+                                          locations_file=tmp_locations,
+                                          chart_links=_chart_links(job_title, pages),
+                                          store=get_job_store())
+    return result and report_cache.path(key)
+
+def _chart_links(job_title, pages):
+    return [(label, f"/jobs/{quote(job_title, safe='')}/{kind}?pages={pages}")
+            for kind, (label, _) in CHARTS.items()]
+
+def _stream_report(job_title, pages, timings=None):
+    """Stream a freshly scraped report while writing it to the cache.
+
+    The report is built under the cache key's lock, like background jobs,
+    so a concurrent stream or job for the same role waits and then serves
+    the entry the first one wrote. The page head goes out before scraping
+    starts and the job table follows in row chunks, so the HTML is never
+    held in memory whole (the job frame itself still is). The cache entry
+    is only committed if the whole report was generated; a client
+    disconnect discards it. The body is produced after the response
+    headers are sent, so a requested timing breakdown (``timings``) ends
+    the page as an HTML comment.
+    """
+    resume_timings(timings)
+    key = report_cache.key(job_title, pages)
+    with report_cache.lock(key):
+        cached = report_cache.get(key)
+        if cached:
+            with open(cached, encoding="utf-8") as f:
+                while chunk := f.read(64 * 1024):
+                    yield chunk
+        else:
+            yield from _build_streamed_report(job_title, pages, key)
+    if timings is not None:
+        yield f"<!-- Server-Timing: {timings.server_timing()} -->\n"
+
+def _build_streamed_report(job_title, pages, key):
+    with report_cache.writing(key) as tmp_path, \
+            report_cache.writing(key, ".locations.json") as tmp_locations, \
+            open(tmp_path, "w", encoding="utf-8") as out:
+        head = report_head(job_title)
+        out.write(head)
+        yield head
+
+        df, aggregates = collect_jobs(job_title, pages, locations_file=tmp_locations,
+                                      store=get_job_store())
+        if df.empty:
+            # Leave both temp files empty so nothing is cached
+            out.seek(0)
+            out.truncate()
+            open(tmp_locations, "w").close()
+            yield "<p>No jobs found.</p>" + REPORT_TAIL
+            return
+
+        for chunk in iter_report_body(df, chart_links=_chart_links(job_title, pages),
+                                      aggregates=aggregates):
+            out.write(chunk)
+            yield chunk
+        out.write(REPORT_TAIL)
+        yield REPORT_TAIL
+
+def _pages_arg():
+    pages = request.args.get("pages", 2, type=int)
+    if not pages or not 1 <= pages <= MAX_PAGES:
+        return None, (jsonify({"error": f"'pages' must be between 1 and {MAX_PAGES}"}), 400)
+    return pages, None
+
+report_jobs = ReportJobManager(
+    _run_report,
+    max_workers=int(os.environ.get("REPORT_WORKERS", 2)),
+    max_queue=int(os.environ.get("REPORT_QUEUE_LIMIT", 20)),
+)
 
 @app.route('/jobs')
 def jobs():
@@ -47,26 +202,358 @@ def jobs():
     if not job_title:
         return jsonify({"error": "Missing 'role' query parameter"}), 400
 
-    safe_title = job_title.replace(" ", "_")
-    output_file = f"{safe_title}_report.html"
+    pages, error = _pages_arg()
+    if error:
+        return error
+
+    cached = report_cache.get(report_cache.key(job_title, pages))
+    if cached:
+        return send_file(cached, mimetype="text/html")
+
+    if request.args.get("stream") == "1":
+        return Response(_stream_report(job_title, pages, current_timings()), mimetype="text/html")
+
+    try:
+        job, created = report_jobs.submit(job_title, pages=pages)
+    except QueueFull as e:
+        response = jsonify({"error": f"Report queue is full: {e}"})
+        response.headers["Retry-After"] = "30"
+        return response, 503
+
+    status_url = url_for("job_status", job_id=job.id)
+    response = jsonify(dict(job.to_dict(), status_url=status_url, deduplicated=not created))
+    response.headers["Location"] = status_url
+    return response, 202
+
+SSE_HEARTBEAT = float(os.environ.get("SSE_HEARTBEAT", 15))
+
+def _sse(event, data, event_id=None):
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event}", f"data: {json.dumps(data)}"]
+    return "\n".join(lines) + "\n\n"
+
+def _stream_job_events(job_title, pages, timings=None):
+    """SSE stream of jobs as they are scraped, ending with a ``done`` event.
+
+    The crawl runs in its own thread and hands records over a queue, so a
+    heartbeat comment goes out whenever nothing arrives for
+    ``SSE_HEARTBEAT`` seconds. A heartbeat written to a disconnected client
+    closes this generator, which flags the crawl to stop; it checks between
+    records and while waiting for a page, pages that have not started are
+    cancelled and collected jobs are stored.
+    A requested timing breakdown (``timings``) is sent with the ``done``
+    event.
+    """
+    events = queue.Queue()
+    cancelled = threading.Event()
+
+    def crawl():
+        resume_timings(timings)
+        aggregates, fetch_report = JobAggregates(normalize_location), {}
+        jobs = iter_naukri_jobs(job_title, pages, store=get_job_store(), fetch_report=fetch_report,
+                                cancel=cancelled)
+        try:
+            for record in jobs:
+                if cancelled.is_set():
+                    break
+                locations = aggregates.add(record, role=job_title)
+                events.put(("job", {"job": record, "counts": {
+                    location: aggregates.location_counts[location] for location in locations}}))
+        except Exception as e:
+            events.put(("error", {"error": str(e)}))
+        finally:
+            jobs.close()
+            events.put(("done", dict(aggregates.to_dict(job_title), cancelled=cancelled.is_set(),
+                                     fetch_report=fetch_report,
+                                     timings=timings.to_dict() if timings is not None else None)))
 
+    threading.Thread(target=crawl, name="sse-crawl", daemon=True).start()
     try:
-        if not os.path.exists(output_file):
-            result = generate_html_report(job_title=job_title, pages=2, create_heatmap=True)
-            if not result:
-                return jsonify({"error": "Failed to scrape jobs"}), 500
+        yield "retry: 5000\n\n"
+        event_id = 0
+        while True:
+            try:
+                event, data = events.get(timeout=SSE_HEARTBEAT)
+            except queue.Empty:
+                yield ": heartbeat\n\n"
+                continue
+            event_id += 1
+            yield _sse(event, data, event_id)
+            if event == "done":
+                return
+    finally:
+        cancelled.set()
 
-        if os.path.exists(output_file):
-            return send_file(output_file)
+@app.route('/jobs/stream')
+def jobs_stream():
+    job_title = request.args.get("role")
+    if not job_title:
+        return jsonify({"error": "Missing 'role' query parameter"}), 400
+
+    pages, error = _pages_arg()
+    if error:
+        return error
+
+    response = Response(_stream_job_events(job_title, pages, current_timings()),
+                        mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+MAX_BATCH_ROLES = int(os.environ.get("MAX_BATCH_ROLES", 50))
+
+@app.route('/jobs/batch', methods=['POST'])
+def jobs_batch():
+    """Queue reports for several roles; their page fetches share one crawl scheduler"""
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict) or not isinstance(body.get("roles"), list):
+        return jsonify({"error": "Expected a JSON object with a 'roles' list"}), 400
+    default_pages = body.get("pages", 2)
+    requests = []
+    for item in body["roles"]:
+        if isinstance(item, str):
+            role, pages = item, default_pages
+        elif isinstance(item, dict):
+            role, pages = item.get("role"), item.get("pages", default_pages)
         else:
-            return jsonify({"error": f"Report not generated for '{job_title}'"}), 500
+            role = pages = None
+        # bool is an int subclass, so reject it explicitly
+        valid_pages = isinstance(pages, int) and not isinstance(pages, bool) and 1 <= pages <= MAX_PAGES
+        if not isinstance(role, str) or not role.strip() or not valid_pages:
+            return jsonify({"error": f"Each role needs a name and 1-{MAX_PAGES} pages: {item!r}"}), 400
+        requests.append((role, pages))
+    if not 1 <= len(requests) <= MAX_BATCH_ROLES:
+        return jsonify({"error": f"'roles' must list 1 to {MAX_BATCH_ROLES} roles"}), 400
+
+    # Already cached roles are still part of the batch but cost nothing to re-run
+    try:
+        batch_id, _ = report_jobs.submit_batch(requests)
+    except QueueFull as e:
+        response = jsonify({"error": f"Report queue is full: {e}"})
+        response.headers["Retry-After"] = "30"
+        return response, 503
+
+    status_url = url_for("batch_status", batch_id=batch_id)
+    response = jsonify({"batch_id": batch_id, "status_url": status_url, "roles": len(requests)})
+    response.headers["Location"] = status_url
+    return response, 202
 
-    except Exception as e:
+@app.route('/jobs/batch/<batch_id>')
+def batch_status(batch_id):
+    """Per-role status and, once every role is done, the cross-role location summary"""
+    jobs = report_jobs.get_batch(batch_id)
+    if jobs is None:
+        return jsonify({"error": f"Unknown batch '{batch_id}'"}), 404
+
+    roles, role_counts = [], {}
+    for job in jobs:
+        if job is None:
+            roles.append({"status": "expired"})
+            continue
+        status = job.to_dict()
+        if job.status == "done":
+            status["report_url"] = url_for("jobs", role=job.role, pages=job.pages)
+            locations = report_cache.get(report_cache.key(job.role, job.pages), ".locations.json")
+            if locations:
+                with open(locations, encoding="utf-8") as f:
+                    role_counts[job.role] = json.load(f)["locations"]
+        roles.append(status)
+
+    done = all(job is not None and job.done for job in jobs)
+    return jsonify({
+        "batch_id": batch_id,
+        "status": "done" if done else "running",
+        "roles": roles,
+        "locations": combine_location_counts(role_counts) if done else None,
+    })
+
+@app.route('/jobs/<job_id>')
+def job_status(job_id):
+    job = report_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": f"Unknown job '{job_id}'"}), 404
+
+    status = job.to_dict()
+    if job.status == "done":
+        status["report_url"] = url_for("jobs", role=job.role, pages=job.pages)
+    return jsonify(status)
+
+# path: roles like "AI/ML Engineer" reach the route with their slash decoded
+@app.route('/jobs/<path:role>/<any("map", "map.png", "chart.png"):kind>')
+def job_chart(role, kind):
+    """Render a location chart on first request and serve it from the cache"""
+    pages, error = _pages_arg()
+    if error:
+        return error
+
+    key = report_cache.key(role, pages)
+    locations = report_cache.get(key, ".locations.json")
+    if not locations:
         return jsonify({
-            "error": f"Error generating job report: {str(e)}",
-            "traceback": traceback.format_exc()
-        }), 500
+            "error": f"No cached results for '{role}'; request the report first",
+            "report_url": url_for("jobs", role=role, pages=pages),
+        }), 404
+
+    if kind == "map":
+        dpi, suffix = None, ".map.html"
+    else:
+        dpi = min(max(request.args.get("dpi", CHART_DPI, type=int) or CHART_DPI, 50), MAX_CHART_DPI)
+        suffix = f".{kind[:-4]}-{dpi}.png"
+
+    def fresh_chart():
+        chart = report_cache.get(key, suffix)
+        if chart and os.path.getmtime(chart) >= os.path.getmtime(locations):
+            return chart
+        return None
+
+    timing = None
+    chart = fresh_chart()
+    if not chart:
+        with report_cache.lock(key + suffix):
+            chart = fresh_chart()
+            if not chart:
+                with open(locations, encoding="utf-8") as f:
+                    data = json.load(f)
+                try:
+                    with report_cache.writing(key, suffix) as tmp_path:
+                        timing = get_render_pool().render(
+                            kind, data["locations"], data["job_title"], tmp_path, dpi=dpi)
+                except RenderTimeout as e:
+                    return jsonify({"error": str(e)}), 503
+                chart = fresh_chart()
+    if not chart:
+        return jsonify({"error": f"Could not render {CHARTS[kind][0].lower()}"}), 500
+
+    response = send_file(chart, mimetype=CHARTS[kind][1], conditional=True, etag=True,
+                         max_age=CHART_MAX_AGE)
+    if timing and "render_seconds" in timing:
+        response.headers["Server-Timing"] = (f"render;dur={timing['render_seconds'] * 1000:.0f}, "
+                                             f"total;dur={timing['wall_seconds'] * 1000:.0f}")
+    return response
+
+JSON_PAGE_SIZE = int(os.environ.get("JSON_PAGE_SIZE", 100))
+MAX_JSON_PAGE_SIZE = 1000
+JSON_DEFAULT_FIELDS = ("title", "location", "experience", "description", "url")
+
+def _encode_cursor(job):
+    raw = json.dumps([job["last_seen"], job["url"]]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def _decode_cursor(cursor):
+    try:
+        last_seen, url = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return float(last_seen), str(url)
+    except (ValueError, TypeError):
+        return None
+
+def _stream_json_page(jobs, fields, layout, limit):
+    """Serialize one page of postings piece by piece; the cursor goes last"""
+    last = None
+    if layout == "columns":
+        # Column arrays need the (bounded) page in memory, never the full result set
+        page = []
+        for job in jobs:
+            if len(page) == limit:
+                last = page[-1]
+                break
+            page.append(job)
+        yield '{"columns":{'
+        for i, field in enumerate(fields):
+            yield ("," if i else "") + json.dumps(field) + ":" + json.dumps([job[field] for job in page])
+        yield '},"count":' + str(len(page))
+    else:
+        yield '{"data":['
+        count, previous = 0, None
+        for job in jobs:
+            if count == limit:
+                last = previous
+                break
+            yield ("," if count else "") + json.dumps({field: job[field] for field in fields})
+            count, previous = count + 1, job
+        yield '],"count":' + str(count)
+    yield ',"next_cursor":' + json.dumps(last and _encode_cursor(last)) + "}"
+
+@app.route('/jobs.json')
+def jobs_json():
+    """Stored postings with filters, field selection and keyset pagination.
+
+    The ETag covers the store version and the normalized query, so an
+    unchanged page is answered with 304 before touching the result set.
+    """
+    args = request.args
+    fields = [f.strip() for f in args.get("fields", ",".join(JSON_DEFAULT_FIELDS)).split(",") if f.strip()]
+    unknown = [f for f in fields if f not in FIELDS]
+    if unknown or not fields:
+        return jsonify({"error": f"Unknown fields {unknown}; choose from {list(FIELDS)}"}), 400
+
+    layout = args.get("layout", "rows")
+    if layout not in ("rows", "columns"):
+        return jsonify({"error": "'layout' must be 'rows' or 'columns'"}), 400
+
+    limit = args.get("limit", JSON_PAGE_SIZE, type=int)
+    if not limit or not 1 <= limit <= MAX_JSON_PAGE_SIZE:
+        return jsonify({"error": f"'limit' must be between 1 and {MAX_JSON_PAGE_SIZE}"}), 400
+
+    filters = {
+        "role": args.get("role") or None,
+        "location": GAZETTEER.normalize(args["location"]) if args.get("location") else None,
+        "since": args.get("since", type=float),
+        "exp_min": args.get("exp_min", type=int),
+        "exp_max": args.get("exp_max", type=int),
+    }
+    for name, kind in (("since", "a number"), ("exp_min", "an integer"), ("exp_max", "an integer")):
+        if args.get(name) and filters[name] is None:
+            return jsonify({"error": f"'{name}' must be {kind}"}), 400
+    cursor = args.get("cursor")
+    after = _decode_cursor(cursor) if cursor else None
+    if cursor and after is None:
+        return jsonify({"error": "Invalid 'cursor'"}), 400
+
+    store = get_job_store()
+    query = json.dumps([store.version(), filters, fields, layout, limit, cursor], sort_keys=True)
+    etag = hashlib.sha1(query.encode("utf-8")).hexdigest()
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    # One extra row tells whether there is a next page
+    jobs = store.iter_jobs(after=after, limit=limit + 1, **filters)
+    response = Response(_stream_json_page(jobs, fields, layout, limit), mimetype="application/json")
+    response.set_etag(etag)
+    return response
+
+MAX_SEARCH_RESULTS = 100
+
+@app.route('/search')
+def search():
+    """Ranked full-text search over stored titles and descriptions"""
+    query = request.args.get("q", "")
+    location = request.args.get("location") or None
+    if not query.strip() and not location:
+        return jsonify({"error": "Missing 'q' or 'location' query parameter"}), 400
+    limit = request.args.get("limit", 20, type=int)
+    if not limit or not 1 <= limit <= MAX_SEARCH_RESULTS:
+        return jsonify({"error": f"'limit' must be between 1 and {MAX_SEARCH_RESULTS}"}), 400
+
+    index = get_search_index(normalize_location)
+    # Pick up postings other workers stored; skipped while a warm-up load is running
+    index.sync(get_job_store(), wait=False)
+    start = time.perf_counter()
+    hits = index.search(query, location=location, limit=limit)
+    took = time.perf_counter() - start
+
+    jobs = get_job_store().get_jobs(key for key, _ in hits)
+    results = [dict(jobs[key], score=score) for key, score in hits if key in jobs]
+    return jsonify({
+        "query": query,
+        "location": normalize_location(location) if location else None,
+        "count": len(results),
+        "took_ms": round(took * 1000, 2),
+        "results": results,
+    })
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
+    warm_search_index(normalize_location)
     app.run(debug=False, host='0.0.0.0', port=port)
\ No newline at end of file
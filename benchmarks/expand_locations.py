@@ -0,0 +1,78 @@
+"""Microbenchmark: vectorized expand_locations vs the original iterrows loop.
+
+    python benchmarks/expand_locations.py --sizes 10000 100000 1000000
+
+The iterrows reference is only timed up to ``--reference-max`` rows (it
+takes minutes at 1M); at those sizes the two outputs are also checked for
+exact equality.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gen_map2 import expand_locations, normalize_location
+
+RAW_LOCATIONS = [
+    "Bengaluru", "Bangalore/Bengaluru", "Hyderabad", "Pune(Hinjewadi)", "Mumbai (All Areas)",
+    "Delhi / NCR", "Gurgaon/Gurugram", "Noida", "Chennai", "Kolkata", "Navi Mumbai",
+    "Greater Noida", "Remote", "Hybrid - Ahmedabad", "Kochi", "Jaipur", "Indore",
+]
+
+
+def make_jobs(rows, seed=0):
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        "Job Title": [f"Data Scientist {i % 97}" for i in range(rows)],
+        "Location": [", ".join(rng.sample(RAW_LOCATIONS, rng.randint(1, 3))) for _ in range(rows)],
+        "Experience": [f"{i % 5}-{i % 5 + 4} Yrs" for i in range(rows)],
+        "Description": ["Python, SQL, machine learning"] * rows,
+        "Job URL": [f"https://www.naukri.com/job-listings-{i}" for i in range(rows)],
+    })
+
+
+def expand_locations_iterrows(df):
+    """The original row-by-row implementation, kept as the reference"""
+    rows = []
+    for _, row in df.iterrows():
+        locations = str(row['Location']).split(',')
+        for loc in locations:
+            new_row = row.copy()
+            new_row['Location'] = normalize_location(loc.strip())
+            rows.append(new_row)
+    return pd.DataFrame(rows)
+
+
+def timed(fn, df):
+    normalize_location.cache_clear()
+    start = time.perf_counter()
+    result = fn(df)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--reference-max", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'vectorized':>12} {'iterrows':>12} {'speedup':>9}  match")
+    for rows in args.sizes:
+        df = make_jobs(rows)
+        fast, fast_s = timed(expand_locations, df)
+
+        if rows <= args.reference_max:
+            slow, slow_s = timed(expand_locations_iterrows, df)
+            pd.testing.assert_frame_equal(fast, slow)
+            print(f"{rows:>10} {fast_s:>11.3f}s {slow_s:>11.3f}s {slow_s / fast_s:>8.1f}x  yes")
+        else:
+            print(f"{rows:>10} {fast_s:>11.3f}s {'-':>12} {'-':>9}  -")
+
+
+if __name__ == "__main__":
+    main()
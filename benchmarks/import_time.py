@@ -0,0 +1,82 @@
+"""Cold-start check: how long a fresh interpreter takes to ``import app``.
+
+    python benchmarks/import_time.py --budget 0.5
+
+Each run is a new process, so nothing is cached in ``sys.modules``. Exits
+with status 1 if the median import time is over ``--budget`` seconds or if
+one of the lazily imported heavy libraries was pulled in at import time.
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Libraries the web app must only import on first use
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib", "seaborn", "selenium", "lxml", "requests",
+                 "chromedriver_binary")
+
+PROBE = f"""
+import sys, time, json
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed,
+                  "heavy": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def probe(module="app"):
+    result = subprocess.run([sys.executable, "-c", PROBE.replace("import app", f"import {module}")],
+                            cwd=ROOT, check=True, capture_output=True, text=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(module="app", top=10):
+    """Cumulative import time per module from ``python -X importtime``"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, check=True, capture_output=True, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=float(os.environ.get("IMPORT_BUDGET", 0.5)))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--module", default="app")
+    args = parser.parse_args()
+
+    runs = [probe(args.module) for _ in range(args.runs)]
+    times = sorted(run["seconds"] for run in runs)
+    median = statistics.median(times)
+    heavy = sorted({name for run in runs for name in run["heavy"]})
+
+    print(f"import {args.module}: median {median * 1000:.0f}ms, "
+          f"min {times[0] * 1000:.0f}ms, max {times[-1] * 1000:.0f}ms over {args.runs} runs "
+          f"(budget {args.budget * 1000:.0f}ms)")
+    print("Slowest imports (cumulative):")
+    for micros, name in slowest_imports(args.module):
+        print(f"  {micros / 1000:>8.1f}ms  {name}")
+
+    failed = False
+    if heavy:
+        print(f"❌ Heavy modules imported eagerly: {', '.join(heavy)}")
+        failed = True
+    if median > args.budget:
+        print(f"❌ Over budget by {(median - args.budget) * 1000:.0f}ms")
+        failed = True
+    if not failed:
+        print("✅ Within budget")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+"""Offline benchmark suite for the scraper, location pipeline, charts and report.
+
+    python benchmarks/suite.py --sizes 1000 100000 1000000 --pages 1 5 20
+    python benchmarks/suite.py --cases expand normalize --compare benchmarks/baseline.json
+    CHROME_LEAN=0 python benchmarks/suite.py --cases browser --output /tmp/full.json
+    python benchmarks/suite.py --cases browser --compare /tmp/full.json
+
+Nothing touches naukri.com: ``get_naukri_jobs`` scrapes copies of the
+recorded results page served by ``fixture_server`` with host pacing turned
+down, and everything else runs on synthetic jobs (see
+``expand_locations.make_jobs``). Each case runs in a fresh process so its
+peak RSS is its own. The ``browser`` case renders pages in Chrome (it
+needs Chrome installed) with images, fonts and a tracker script attached, to
+measure the lean profile in ``chrome_profile`` against ``CHROME_LEAN=0``. Results (throughput, latency percentiles, peak RSS)
+are printed and saved as JSON; ``--compare`` prints the change against an
+earlier run.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import resource
+import tempfile
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Benchmark the code, not the politeness sleeps; charts render off-screen
+os.environ.setdefault("CRAWL_HOST_INTERVAL", "0.001")
+os.environ.setdefault("CRAWL_HOST_BURST", "1000")
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+from expand_locations import RAW_LOCATIONS, make_jobs  # noqa: E402
+
+ROLE = "Data Scientist"
+FIXTURE = os.path.join(ROOT, "fixtures", "naukri_search_page.html")
+
+
+# ----------- Fixtures -----------
+def write_result_pages(directory, role, pages):
+    """Copies of the recorded page, one per page number, with page-unique job URLs"""
+    with open(FIXTURE, encoding="utf-8") as f:
+        recorded = f.read()
+    for page in range(1, pages + 1):
+        name = f"{role.replace(' ', '-')}-jobs-{page}.html"
+        with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+            f.write(recorded.replace("/job-listings-", f"/job-listings-p{page}-"))
+
+
+# Assets attached to the result pages for the browser case: (name, size in bytes)
+PAGE_ASSETS = [("logo-%d.png", 40_000), ("banner-%d.jpg", 150_000), ("brand-%d.woff2", 60_000)]
+# Served locally; the path still matches the "trackers" block patterns
+TRACKER = "/googletagmanager.com/gtm.js"
+
+
+def write_heavy_result_pages(directory, role, pages):
+    """Result pages that also load images, a font and a tracker, like the live site"""
+    write_result_pages(directory, role, pages)
+    with open(os.path.join(directory, "gtm.js"), "w", encoding="utf-8") as f:
+        f.write("window.dataLayer = [];" + "//" + "x" * 80_000)
+    for page in range(1, pages + 1):
+        tags = []
+        for pattern, size in PAGE_ASSETS:
+            # Each page has its own logos plus assets shared by every page (cacheable)
+            for name in (pattern % page, pattern % 0):
+                with open(os.path.join(directory, name), "wb") as f:
+                    f.write(os.urandom(size))
+                if name.endswith(".woff2"):
+                    tags.append(f'<link rel="preload" as="font" crossorigin href="/{name}">')
+                else:
+                    tags.append(f'<img src="/{name}">')
+        tags.append(f'<script async src="{TRACKER}"></script>')
+        path = os.path.join(directory, f"{role.replace(' ', '-')}-jobs-{page}.html")
+        with open(path, encoding="utf-8") as f:
+            page_html = f.read()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(page_html.replace("</body>", "".join(tags) + "</body>", 1))
+
+
+def make_raw_locations(count, seed=0):
+    """``count`` distinct raw location strings in the shapes Naukri uses"""
+    rng = random.Random(seed)
+    return [f"{rng.choice(RAW_LOCATIONS)} ({rng.choice(['Sector', 'Phase', 'Zone'])} {i})"
+            for i in range(count)]
+
+
+def location_counts(rows):
+    from gen_map2 import expand_locations
+    from job_schema import compact_jobs, jobs_per_location
+    return jobs_per_location(compact_jobs(expand_locations(make_jobs(rows)))).to_dict()
+
+
+# ----------- Cases -----------
+# Each case takes (size, repeats, workdir) and returns (items, latency samples, extra)
+def bench_scrape(pages, repeats, workdir):
+    from fixture_server import serve_fixtures
+    from naukri_scrape import get_naukri_jobs
+
+    write_result_pages(workdir, ROLE, pages)
+    samples, jobs = [], 0
+    with serve_fixtures(workdir, default=None) as base_url:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            df = get_naukri_jobs(ROLE, pages=pages, backend="http", base_url=base_url)
+            samples.append(time.perf_counter() - start)
+            jobs = len(df)
+    return pages * repeats, samples, {"jobs": jobs, "unit": "pages"}
+
+
+def bench_browser(pages, repeats, workdir):
+    from fixture_server import serve_fixtures
+    from naukri_scrape import get_naukri_jobs
+
+    write_heavy_result_pages(workdir, ROLE, pages)
+    samples, weights = [], []
+    with serve_fixtures(workdir, default=None) as base_url:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            df = get_naukri_jobs(ROLE, pages=pages, backend="selenium", base_url=base_url)
+            samples.append(time.perf_counter() - start)
+            weights += df.attrs["fetch_report"].get("page_weights", [])
+    loads = [w["load_seconds"] for w in weights if w["load_seconds"] is not None]
+    return pages * repeats, samples, {
+        "unit": "pages",
+        "lean": os.environ.get("CHROME_LEAN", "1") == "1",
+        "bytes_per_page": round(sum(w["bytes"] for w in weights) / len(weights)) if weights else None,
+        "requests_per_page": round(sum(w["requests"] for w in weights) / len(weights), 1) if weights else None,
+        "dom_ready_p50": percentile(sorted(loads), 0.50),
+    }
+
+
+def bench_expand(rows, repeats, workdir):
+    from gen_map2 import expand_locations, normalize_location
+
+    df = make_jobs(rows)
+    samples = []
+    for _ in range(repeats):
+        normalize_location.cache_clear()
+        start = time.perf_counter()
+        expand_locations(df)
+        samples.append(time.perf_counter() - start)
+    return rows * repeats, samples, {"unit": "rows"}
+
+
+def bench_compact(rows, repeats, workdir):
+    from gen_map2 import expand_locations
+    from job_schema import compact_jobs, memory_per_row
+
+    df = expand_locations(make_jobs(rows))
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        compact = compact_jobs(df)
+        samples.append(time.perf_counter() - start)
+    return len(df) * repeats, samples, {
+        "unit": "rows",
+        "bytes_per_row": round(memory_per_row(df), 1),
+        "compact_bytes_per_row": round(memory_per_row(compact), 1),
+    }
+
+
+def bench_normalize(count, repeats, workdir):
+    from gen_map2 import normalize_location
+
+    raw = make_raw_locations(count)
+    samples = []
+    clock = time.perf_counter
+    for _ in range(repeats):
+        normalize_location.cache_clear()
+        for location in raw:
+            start = clock()
+            normalize_location(location)
+            samples.append(clock() - start)
+    return count * repeats, samples, {"unit": "lookups", "cache": "cold"}
+
+
+def _bench_chart(kind, dpi):
+    def bench(rows, repeats, workdir):
+        from charts import CHART_RENDERERS
+
+        counts = location_counts(rows)
+        output = os.path.join(workdir, "chart" + (".html" if kind == "map" else ".png"))
+        samples, status = [], "ok"
+        for _ in range(repeats):
+            start = time.perf_counter()
+            if CHART_RENDERERS[kind](counts, ROLE, output, dpi) is None:
+                status = "failed"
+            samples.append(time.perf_counter() - start)
+        return repeats, samples, {"unit": "charts", "locations": len(counts), "status": status}
+    return bench
+
+
+def bench_report(rows, repeats, workdir):
+    from fixture_server import serve_fixtures
+    from gen_map2 import generate_html_report
+    from job_store import JobStore
+
+    store = JobStore(os.path.join(workdir, "jobs.db"))
+    df = make_jobs(rows)
+    for start in range(0, rows, 50_000):
+        store.upsert(df.iloc[start:start + 50_000].to_dict("records"), role=ROLE)
+    del df
+
+    write_result_pages(workdir, ROLE, 1)
+    output = os.path.join(workdir, "report.html")
+    samples = []
+    with serve_fixtures(workdir, default=None) as base_url:
+        import naukri_scrape
+        naukri_scrape.NAUKRI_BASE_URL = base_url
+        for _ in range(repeats):
+            start = time.perf_counter()
+            generate_html_report(ROLE, pages=1, create_heatmap=False, output_file=output, store=store)
+            samples.append(time.perf_counter() - start)
+    return rows * repeats, samples, {"unit": "rows", "bytes": os.path.getsize(output)}
+
+
+# name -> (function, heavy); heavy cases skip sizes above --heavy-max
+CASES = {
+    "scrape": (bench_scrape, False),
+    "browser": (bench_browser, False),
+    "expand": (bench_expand, False),
+    "compact": (bench_compact, False),
+    "normalize": (bench_normalize, False),
+    "map": (_bench_chart("map", None), False),
+    "map.png": (_bench_chart("map.png", 150), False),
+    "chart.png": (_bench_chart("chart.png", 150), False),
+    "report": (bench_report, True),
+}
+
+
+# ----------- Runner -----------
+def percentile(ordered, fraction):
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_case(name, size, repeats):
+    """Run one case in this (fresh) process and summarise it"""
+    with tempfile.TemporaryDirectory() as workdir:
+        items, samples, extra = CASES[name][0](size, repeats, workdir)
+
+    ordered = sorted(samples)
+    total = sum(samples)
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_kb //= 1024
+    return {
+        "case": name,
+        "size": size,
+        "repeats": repeats,
+        "items": items,
+        "seconds": round(total, 6),
+        "throughput": round(items / total, 3) if total else None,
+        "p50": percentile(ordered, 0.50),
+        "p95": percentile(ordered, 0.95),
+        "p99": percentile(ordered, 0.99),
+        "peak_rss_mb": round(peak_kb / 1024, 1),
+        **extra,
+    }
+
+
+def run_isolated(name, size, repeats):
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run_case, name, size, repeats).result()
+
+
+def revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def fmt_seconds(value):
+    if value is None:
+        return "-"
+    if value < 1e-3:
+        return f"{value * 1e6:.1f}us"
+    if value < 1:
+        return f"{value * 1e3:.1f}ms"
+    return f"{value:.2f}s"
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {(r["case"], r["size"]): r for r in baseline["results"]}
+
+    print(f"\nAgainst {baseline_path} (revision {baseline.get('revision')}):")
+    print(f"{'case':>10} {'size':>9} {'throughput':>11} {'p50':>8} {'peak RSS':>9}")
+    for result in results:
+        old = previous.get((result["case"], result["size"]))
+        if not old or not old.get("throughput") or not result.get("throughput"):
+            continue
+        print(f"{result['case']:>10} {result['size']:>9} "
+              f"{result['throughput'] / old['throughput']:>10.2f}x "
+              f"{result['p50'] / old['p50']:>7.2f}x "
+              f"{result['peak_rss_mb'] - old['peak_rss_mb']:>+8.1f}M"
+              + (f"  bytes/page {result['bytes_per_page'] / old['bytes_per_page']:.2f}x"
+                 if result.get("bytes_per_page") and old.get("bytes_per_page") else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES),
+                        default=[name for name in CASES if name != "browser"],
+                        help="cases to run; 'browser' needs Chrome and is opt-in")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000],
+                        help="synthetic job rows (distinct raw locations for 'normalize')")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 5, 20],
+                        help="result pages for 'scrape' and 'browser'")
+    parser.add_argument("--heavy-max", type=int, default=100_000,
+                        help="largest size for end-to-end report cases")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmarks", "baseline.json"))
+    parser.add_argument("--compare", help="earlier JSON output to compare against")
+    args = parser.parse_args()
+
+    print(f"{'case':>10} {'size':>9} {'throughput':>16} {'p50':>9} {'p95':>9} {'p99':>9} {'peak RSS':>9}")
+    results = []
+    for name in args.cases:
+        heavy = CASES[name][1]
+        sizes = args.pages if name in ("scrape", "browser") else args.sizes
+        for size in sizes:
+            if heavy and size > args.heavy_max:
+                continue
+            result = run_isolated(name, size, args.repeats)
+            results.append(result)
+            rate = f"{result['throughput']:,.0f} {result['unit']}/s" if result["throughput"] else "-"
+            print(f"{name:>10} {size:>9} {rate:>16} {fmt_seconds(result['p50']):>9} "
+                  f"{fmt_seconds(result['p95']):>9} {fmt_seconds(result['p99']):>9} "
+                  f"{result['peak_rss_mb']:>8.1f}M", flush=True)
+
+    if args.compare:
+        compare(results, args.compare)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "revision": revision(),
+            "created": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }, f, indent=2)
+    print(f"\nSaved {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
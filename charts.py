@@ -0,0 +1,225 @@
+"""Chart renderers for per-location job counts.
+
+Every renderer takes ``location_counts`` as a plain ``{location: count}``
+mapping (sorted by count, largest first) so it can be shipped cheaply to a
+render worker process. The matplotlib charts use the object-oriented
+``Figure`` API and never touch pyplot's global state.
+"""
+import os
+import math
+import logging
+import numpy as np
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.colors import Normalize
+from matplotlib.cm import ScalarMappable
+from matplotlib.patches import Circle
+
+from gazetteer import GAZETTEER
+
+log = logging.getLogger(__name__)
+
+
+def get_city_coordinates():
+    """Return coordinates for Indian cities from the shared gazetteer"""
+    return GAZETTEER.coordinates
+
+def report_unmapped(location_counts, city_coords):
+    """Print locations that cannot be placed on a map instead of dropping them silently"""
+    unmapped = [location for location in location_counts if location not in city_coords]
+    if unmapped:
+        log.warning("⚠️ No coordinates for %d locations: %s",
+                    len(unmapped), ", ".join(map(str, unmapped[:10])))
+    return unmapped
+
+# ----------- India Map Heatmap -----------
+HEATMAP_SCALE = os.environ.get("HEATMAP_SCALE", "linear")
+HEATMAP_BIN_THRESHOLD = int(os.environ.get("HEATMAP_BIN_THRESHOLD", 200))
+HEATMAP_CELL_DEGREES = float(os.environ.get("HEATMAP_CELL_DEGREES", 0.5))
+MAX_MARKERS = int(os.environ.get("HEATMAP_MAX_MARKERS", 100))
+
+def heatmap_points(location_counts, city_coords, scale="linear", cell_degrees=None):
+    """Weighted ``[lat, lon, weight]`` heatmap points with weights in (0, 1].
+
+    Without ``cell_degrees`` there is one point per mapped city. With it,
+    cities are binned into ``cell_degrees``-sized grid cells and each cell
+    becomes one point at its job-weighted centroid, so the point count is
+    bounded by the grid rather than by the number of cities. Weights are
+    each point's job count relative to the busiest point, on a linear or
+    ``"log"`` scale.
+    """
+    cells = {}
+    for location, count in location_counts.items():
+        coords = city_coords.get(location)
+        if coords is None or count <= 0:
+            continue
+        lat, lon = coords
+        key = location if cell_degrees is None else (
+            math.floor(lat / cell_degrees), math.floor(lon / cell_degrees))
+        total, lat_sum, lon_sum = cells.get(key, (0, 0.0, 0.0))
+        cells[key] = (total + count, lat_sum + lat * count, lon_sum + lon * count)
+
+    if not cells:
+        return []
+    peak = max(total for total, _, _ in cells.values())
+    if scale == "log":
+        weight = lambda total: math.log1p(total) / math.log1p(peak)
+    else:
+        weight = lambda total: total / peak
+    return [[lat_sum / total, lon_sum / total, round(weight(total), 4)]
+            for total, lat_sum, lon_sum in cells.values()]
+
+def render_india_map(location_counts, job_title, map_file, dpi=None, scale=None, grid=None):
+    """Render the interactive India heatmap from per-location job counts
+
+    ``grid`` forces (True) or disables (False) grid-binned heatmap points;
+    by default binning kicks in above ``HEATMAP_BIN_THRESHOLD`` cities.
+    """
+    try:
+        import folium
+        from folium.plugins import HeatMap
+    except ImportError:
+        log.error("❌ Folium not installed; run 'pip install folium' for map generation")
+        return None
+
+    city_coords = get_city_coordinates()
+    report_unmapped(location_counts, city_coords)
+
+    # Create base map centered on India
+    india_map = folium.Map(
+        location=[20.5937, 78.9629],  # Center of India
+        zoom_start=5,
+        tiles='OpenStreetMap'
+    )
+
+    # One weighted point per city, or per grid cell once there are many cities
+    mapped = [(location, count) for location, count in location_counts.items()
+              if location in city_coords]
+    binned = len(mapped) > HEATMAP_BIN_THRESHOLD if grid is None else grid
+    heat_data = heatmap_points(location_counts, city_coords, scale=scale or HEATMAP_SCALE,
+                               cell_degrees=HEATMAP_CELL_DEGREES if binned else None)
+
+    # Add heatmap layer
+    if heat_data:
+        gradient = {'0.2': 'blue', '0.4': 'lime', '0.6': 'orange', '1.0': 'red'}
+        HeatMap(heat_data, radius=15, blur=10, gradient=gradient, min_opacity=0.3).add_to(india_map)
+
+    # Add markers with job counts for the busiest cities
+    mapped.sort(key=lambda item: item[1], reverse=True)
+    for location, count in mapped[:MAX_MARKERS]:
+        lat, lon = city_coords[location]
+        folium.CircleMarker(
+            location=[lat, lon],
+            radius=min(count/2 + 5, 20),  # Size based on job count
+            popup=f'<b>{location}</b><br>{count} jobs',
+            tooltip=f'{location}: {count} jobs',
+            color='darkred',
+            fill=True,
+            fillColor='red',
+            fillOpacity=0.7
+        ).add_to(india_map)
+
+    # Save the map
+    india_map.save(map_file)
+    return map_file
+
+# ----------- Static India Heatmap -----------
+def render_static_india_heatmap(location_counts, job_title, static_map_file, dpi=300):
+    """Render the static India heatmap PNG from per-location job counts"""
+    try:
+        city_coords = get_city_coordinates()
+        report_unmapped(location_counts, city_coords)
+        cmap = matplotlib.colormaps['YlOrRd']
+
+        fig = Figure(figsize=(15, 12))
+        ax = fig.add_subplot()
+
+        # India boundary coordinates (simplified)
+        india_boundary = {
+            'lat_min': 6, 'lat_max': 37,
+            'lon_min': 68, 'lon_max': 98
+        }
+        ax.set_xlim(india_boundary['lon_min'], india_boundary['lon_max'])
+        ax.set_ylim(india_boundary['lat_min'], india_boundary['lat_max'])
+
+        # Plot cities with job counts
+        max_jobs = max(location_counts.values(), default=1)
+
+        for location, count in location_counts.items():
+            if location in city_coords:
+                lat, lon = city_coords[location]
+                color_intensity = count / max_jobs
+
+                # Plot circle
+                circle = Circle((lon, lat), radius=0.5,
+                                alpha=0.6 + 0.4 * color_intensity,
+                                color=cmap(color_intensity))
+                ax.add_patch(circle)
+
+                # Add city name and count
+                ax.annotate(f'{location}\n({count})',
+                            (lon, lat),
+                            xytext=(5, 5),
+                            textcoords='offset points',
+                            fontsize=8,
+                            bbox=dict(boxstyle='round,pad=0.3',
+                                      facecolor='white',
+                                      alpha=0.8))
+
+        # Styling
+        ax.set_title(f'{job_title} Jobs Distribution Across India',
+                     fontsize=16, fontweight='bold', pad=20)
+        ax.set_xlabel('Longitude', fontsize=12)
+        ax.set_ylabel('Latitude', fontsize=12)
+        ax.grid(True, alpha=0.3)
+
+        # Add a colorbar
+        sm = ScalarMappable(cmap=cmap, norm=Normalize(vmin=0, vmax=max_jobs))
+        sm.set_array([])
+        cbar = fig.colorbar(sm, ax=ax, shrink=0.6)
+        cbar.set_label('Number of Jobs', rotation=270, labelpad=20)
+
+        fig.tight_layout()
+        fig.savefig(static_map_file, dpi=dpi, bbox_inches='tight', facecolor='white')
+        return static_map_file
+
+    except Exception as e:
+        log.error("❌ Error creating static heatmap: %s", e)
+        return None
+
+# ----------- Location Bar Chart -----------
+def render_location_chart(location_counts, job_title, chart_file, dpi=300):
+    """Render the top-15 locations bar chart PNG from per-location job counts"""
+
+    # Top locations by job count
+    top = sorted(location_counts.items(), key=lambda item: item[1], reverse=True)[:15]
+    labels = [location for location, _ in top]
+    values = [count for _, count in top]
+
+    fig = Figure(figsize=(14, 8))
+    ax = fig.add_subplot()
+
+    # Create horizontal bar chart for better readability
+    ax.barh(range(len(values)), values,
+            color=matplotlib.colormaps['viridis'](np.linspace(0, 1, len(values))))
+
+    # Customize the plot
+    ax.set_yticks(range(len(values)), labels)
+    ax.set_xlabel('Number of Jobs', fontsize=12, fontweight='bold')
+    ax.set_title(f'{job_title} Jobs Distribution - Top 15 Locations',
+                 fontsize=16, fontweight='bold', pad=20)
+
+    # Add value labels on bars
+    for i, value in enumerate(values):
+        ax.text(value + max(values) * 0.01, i, str(value), va='center', fontweight='bold')
+
+    ax.grid(axis='x', alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(chart_file, dpi=dpi, bbox_inches='tight', facecolor='white')
+    return chart_file
+
+CHART_RENDERERS = {
+    "map": render_india_map,
+    "map.png": render_static_india_heatmap,
+    "chart.png": render_location_chart,
+}
@@ -0,0 +1,117 @@
+"""Lean Chrome profile for scraping: request blocking, eager loads, shared cache.
+
+Every ``driver.get`` used to pull in images, fonts, trackers and ads and
+wait for the full ``load`` event. With the lean profile (``CHROME_LEAN=1``,
+the default):
+
+* requests matching the block list never leave the browser. Chrome's CDP
+  ``Network.setBlockedURLs`` does the blocking, and the images content
+  setting also catches CSS backgrounds and ``data:`` images;
+* ``pageLoadStrategy`` is "eager", so ``get`` returns at DOMContentLoaded.
+  The wait policy then waits for the cards themselves;
+* drivers share one disk cache directory, so static assets that are still
+  allowed are fetched once rather than once per driver.
+
+``CHROME_BLOCK`` and ``CHROME_ALLOW`` are comma-separated lists of group
+names (see ``RESOURCE_GROUPS``) or CDP URL patterns, where ``*`` matches
+anything. Allowed entries are taken out of the block list, so
+``CHROME_ALLOW=fonts`` loads fonts again. JavaScript stays on: Naukri
+renders its cards client-side and extraction runs a script.
+"""
+import os
+import logging
+
+log = logging.getLogger(__name__)
+
+RESOURCE_GROUPS = {
+    "images": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*"],
+    "fonts": ["*.woff*", "*.ttf*", "*.otf*", "*.eot*"],
+    "media": ["*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*"],
+    "trackers": ["*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+                 "*googlesyndication.com*", "*facebook.net*", "*hotjar.com*", "*clarity.ms*"],
+}
+
+DEFAULT_BLOCK = "images,fonts,media,trackers"
+
+LEAN = os.environ.get("CHROME_LEAN", "1") == "1"
+CACHE_DIR = os.environ.get("CHROME_CACHE_DIR", "chrome_cache")
+CACHE_BYTES = int(os.environ.get("CHROME_CACHE_BYTES", 100 * 1024 * 1024))
+PAGE_LOAD_STRATEGY = os.environ.get("CHROME_PAGE_LOAD_STRATEGY", "eager")
+
+
+def _entries(value):
+    return [entry.strip() for entry in (value or "").split(",") if entry.strip()]
+
+
+def block_list(block=None, allow=None):
+    """``(groups, patterns)`` to block once ``allow`` entries are taken out"""
+    block = _entries(os.environ.get("CHROME_BLOCK", DEFAULT_BLOCK) if block is None else block)
+    allow = set(_entries(os.environ.get("CHROME_ALLOW", "") if allow is None else allow))
+
+    groups = [entry for entry in block if entry in RESOURCE_GROUPS and entry not in allow]
+    patterns = [pattern for group in groups for pattern in RESOURCE_GROUPS[group]]
+    patterns += [entry for entry in block if entry not in RESOURCE_GROUPS]
+    return groups, list(dict.fromkeys(pattern for pattern in patterns if pattern not in allow))
+
+
+def apply_lean_options(options):
+    """Set page-load strategy, content settings and the shared cache on Chrome ``Options``"""
+    if not LEAN:
+        return options
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
+
+    groups, _ = block_list()
+    if "images" in groups:
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    if CACHE_DIR:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        options.add_argument(f"--disk-cache-dir={os.path.abspath(CACHE_DIR)}")
+        options.add_argument(f"--disk-cache-size={CACHE_BYTES}")
+    return options
+
+
+def block_resources(driver):
+    """Install the URL block list on a new driver; returns the patterns in force"""
+    if not LEAN:
+        return []
+    _, patterns = block_list()
+    if not patterns:
+        return []
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        log.warning("⚠️ Could not install Chrome request blocking: %s", e)
+        return []
+    return patterns
+
+
+PAGE_WEIGHT_JS = """
+const navigation = performance.getEntriesByType('navigation')[0];
+const entries = performance.getEntriesByType('resource');
+if (navigation) entries.push(navigation);
+return {
+    bytes: entries.reduce((total, entry) => total + (entry.transferSize || 0), 0),
+    requests: entries.length,
+    dom_ready: navigation ? navigation.domContentLoadedEventEnd / 1000 : null,
+};
+"""
+
+
+def page_weight(driver):
+    """Bytes transferred, request count and DOM-ready seconds for the current page.
+
+    Uses the Resource Timing API: blocked requests never appear, cache hits
+    count as 0 bytes, and cross-origin resources without a
+    ``Timing-Allow-Origin`` header also report 0.
+    """
+    try:
+        weight = driver.execute_script(PAGE_WEIGHT_JS) or {}
+    except Exception:
+        return None
+    return {
+        "bytes": int(weight.get("bytes") or 0),
+        "requests": int(weight.get("requests") or 0),
+        "load_seconds": weight.get("dom_ready"),
+    }
@@ -0,0 +1,90 @@
+import os
+import threading
+import contextvars
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from wait_policy import get_wait_policy
+
+
+class CrawlCancelled(Exception):
+    """Raised by a scheduled fetch whose crawl was cancelled before it started"""
+
+
+def host_of(url):
+    return urlsplit(url).netloc.lower()
+
+
+class CrawlScheduler:
+    """Bounded worker pool for page fetches with per-host politeness.
+
+    ``max_workers`` caps how many fetches run at once across all hosts.
+    Each host additionally gets at most ``per_host_concurrency`` fetches in
+    flight, and fetch starts are paced by the wait policy's per-host token
+    bucket and backoff.
+    """
+
+    def __init__(self, max_workers=4, per_host_concurrency=2, wait_policy=None):
+        self.max_workers = max_workers
+        self.per_host_concurrency = per_host_concurrency
+        self.wait_policy = wait_policy or get_wait_policy()
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crawl")
+        self._lock = threading.Lock()
+        self._host_slots = {}
+
+    @contextmanager
+    def host_slot(self, host):
+        """Hold one of the host's concurrency slots, waiting for its politeness budget"""
+        with self._lock:
+            slots = self._host_slots.setdefault(
+                host, threading.BoundedSemaphore(self.per_host_concurrency))
+        slots.acquire()
+        try:
+            self.wait_policy.before_fetch(host)
+            yield
+        finally:
+            slots.release()
+
+    def submit(self, host, fn, *args, cancel=None, **kwargs):
+        """Schedule ``fn`` under ``host``'s politeness budget.
+
+        ``cancel`` is an optional ``threading.Event``. If it is set by the
+        time the task holds its host slot, ``fn`` is skipped and the future
+        raises ``CrawlCancelled``. ``Future.cancel`` alone cannot do this,
+        because the task is already running while it waits for the slot.
+        """
+        def run():
+            if cancel is not None and cancel.is_set():
+                raise CrawlCancelled(host)
+            with self.host_slot(host):
+                if cancel is not None and cancel.is_set():
+                    raise CrawlCancelled(host)
+                return fn(*args, **kwargs)
+        # Carry the caller's context (e.g. its request timing collector) into the worker
+        return self._executor.submit(contextvars.copy_context().run, run)
+
+    def map(self, host, fn, items):
+        """Run ``fn(item)`` for every item concurrently; results keep item order"""
+        futures = [self.submit(host, fn, item) for item in items]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """Return the process-wide crawl scheduler, creating it on first use"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = CrawlScheduler(
+                max_workers=int(os.environ.get("CRAWL_MAX_WORKERS", 4)),
+                per_host_concurrency=int(os.environ.get("CRAWL_PER_HOST", 2)),
+            )
+        return _scheduler
@@ -0,0 +1,186 @@
+import os
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+
+
+class DriverPoolError(Exception):
+    """Raised when the pool cannot hand out a driver"""
+
+
+class DriverPoolTimeout(DriverPoolError):
+    """Raised when no driver became free within the checkout timeout"""
+
+
+class DriverPool:
+    """Bounded, thread-safe pool of warm Chrome drivers.
+
+    Drivers are created lazily by ``factory`` up to ``size``. On checkin each
+    driver is health checked and reset (extra tabs closed, cookies cleared);
+    drivers that fail the check, raised a crash, or reached ``max_uses`` are
+    quit and replaced on the next checkout.
+    """
+
+    def __init__(self, factory, size=2, max_uses=50, checkout_timeout=60):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.checkout_timeout = checkout_timeout
+
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._uses = {}
+        self._closed = False
+        self._stats = {"created": 0, "recycled": 0, "crashed": 0, "checkouts": 0}
+
+    # ----------- Checkout / Checkin -----------
+    def acquire(self, timeout=None):
+        """Check out a healthy driver, creating one if no warm driver is idle"""
+        if self._closed:
+            raise DriverPoolError("Driver pool is shut down")
+
+        timeout = self.checkout_timeout if timeout is None else timeout
+        if not self._slots.acquire(timeout=timeout):
+            raise DriverPoolTimeout(f"No Chrome driver available after {timeout}s")
+
+        try:
+            driver = self._take_idle()
+            if driver is None:
+                driver = self.factory()
+                if driver is None:
+                    raise DriverPoolError("Chrome driver setup failed")
+                with self._lock:
+                    self._uses[id(driver)] = 0
+                    self._stats["created"] += 1
+        except BaseException:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._uses[id(driver)] += 1
+            self._stats["checkouts"] += 1
+        return driver
+
+    def release(self, driver, broken=False):
+        """Return a driver to the pool, recycling it if needed"""
+        try:
+            with self._lock:
+                uses = self._uses.get(id(driver), 0)
+            if broken:
+                with self._lock:
+                    self._stats["crashed"] += 1
+                self._discard(driver)
+            elif self._closed or uses >= self.max_uses:
+                with self._lock:
+                    self._stats["recycled"] += 1
+                self._discard(driver)
+            elif not self._reset(driver):
+                with self._lock:
+                    self._stats["crashed"] += 1
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Context manager form of acquire/release.
+
+        Any exception escaping the block marks the driver as broken so a
+        crashed browser is never handed out again.
+        """
+        driver = self.acquire(timeout=timeout)
+        broken = False
+        try:
+            yield driver
+        except BaseException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    # ----------- Health / Reset -----------
+    def _take_idle(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if self._is_alive(driver):
+                return driver
+            with self._lock:
+                self._stats["crashed"] += 1
+            self._discard(driver)
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(driver):
+        """Close extra tabs, drop cookies and park the driver on a blank page"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    # ----------- Lifecycle -----------
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["warm"] = len(self._uses)
+        stats["size"] = self.size
+        stats["idle"] = self._idle.qsize()
+        stats["in_use"] = stats["warm"] - stats["idle"]
+        return stats
+
+    def shutdown(self):
+        """Quit every idle driver; drivers still checked out are quit on release"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(factory):
+    """Return the process-wide pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool(
+                factory,
+                size=int(os.environ.get("CHROME_POOL_SIZE", 2)),
+                max_uses=int(os.environ.get("CHROME_POOL_MAX_USES", 50)),
+                checkout_timeout=float(os.environ.get("CHROME_POOL_TIMEOUT", 60)),
+            )
+            atexit.register(_pool.shutdown)
+        return _pool
@@ -0,0 +1,55 @@
+import os
+import mimetypes
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+def _make_handler(directory, default):
+    class FixtureHandler(BaseHTTPRequestHandler):
+        """Serve recorded results pages: /<role>-jobs-<n> -> <role>-jobs-<n>.html
+
+        Paths with an extension are served as-is (images, fonts, scripts a
+        page references).
+        """
+
+        def do_GET(self):
+            name = os.path.basename(urlsplit(self.path).path.strip("/"))
+            path = os.path.join(directory, name)
+            if os.path.splitext(name)[1] and os.path.isfile(path):
+                content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            else:
+                path = os.path.join(directory, name + ".html")
+                content_type = "text/html; charset=utf-8"
+            if not os.path.exists(path) and default:
+                path = os.path.join(directory, default)
+            if not os.path.exists(path):
+                self.send_error(404)
+                return
+
+            with open(path, "rb") as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+@contextmanager
+def serve_fixtures(directory="fixtures", default="naukri_search_page.html"):
+    """Run a local stand-in for naukri.com and yield its base URL"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(directory, default))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,92 @@
+import os
+import re
+import json
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "gazetteer.json")
+
+_CLEAN_PUNCT = re.compile(r"[(),\-{}\[\]]")
+_CLEAN_SPACE = re.compile(r"\s+")
+
+# Trie terminal marker; tokens are strings so None can never collide
+_END = None
+
+
+def clean_tokens(location):
+    """Lower-case, strip punctuation and split a raw location into tokens"""
+    cleaned = location.lower().replace("/", " ")
+    cleaned = _CLEAN_PUNCT.sub(" ", cleaned)
+    return _CLEAN_SPACE.sub(" ", cleaned).strip().split()
+
+
+class Gazetteer:
+    """Alias and coordinate index for Indian job locations.
+
+    Every city name and alias, state name and qualifier ("remote", "hybrid",
+    ...) is compiled into a token trie, so multi-word names such as "navi
+    mumbai" or "greater noida" match as a unit and lookups cost one pass
+    over the input tokens. Cities take priority; a location that only names
+    a state or a remote qualifier resolves to that.
+    """
+
+    def __init__(self, data):
+        self.coordinates = {}
+        self._trie = {}
+
+        for city in data["cities"]:
+            name = city["name"]
+            self.coordinates[name] = (city["lat"], city["lon"])
+            self._add(name, "city", name)
+            for alias in city.get("aliases", []):
+                self._add(alias, "city", name)
+        for state in data.get("states", []):
+            self._add(state, "state", state)
+        for phrase, canonical in data.get("qualifiers", {}).items():
+            self._add(phrase, "remote" if canonical else "skip", canonical)
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _add(self, phrase, kind, canonical):
+        node = self._trie
+        for token in clean_tokens(phrase):
+            node = node.setdefault(token, {})
+        node[_END] = (kind, canonical)
+
+    def _longest_match(self, tokens, start):
+        node, match, end = self._trie, None, start
+        for i in range(start, len(tokens)):
+            node = node.get(tokens[i])
+            if node is None:
+                break
+            if _END in node:
+                match, end = node[_END], i + 1
+        return match, end
+
+    def normalize(self, location):
+        """Canonical location name for a single (comma-free) raw location"""
+        tokens = clean_tokens(location)
+        fallback = None
+        i = 0
+        while i < len(tokens):
+            match, end = self._longest_match(tokens, i)
+            if match is None:
+                i += 1
+                continue
+            kind, canonical = match
+            if kind == "city":
+                return canonical
+            if kind == "remote" or (kind == "state" and fallback is None):
+                fallback = canonical
+            i = end
+
+        if fallback:
+            return fallback
+        return tokens[0].capitalize() if tokens else location.title()
+
+    def coordinates_for(self, name):
+        return self.coordinates.get(name)
+
+
+GAZETTEER = Gazetteer.load()
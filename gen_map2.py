@@ -1,328 +1,120 @@
-import pandas as pd
-import re
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-from naukri_scrape import get_naukri_jobs
+import os
+import sys
+import json
+import html
+import time
+import logging
+import argparse
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from gazetteer import GAZETTEER
+from job_aggregates import JobAggregates
+from job_schema import compact_jobs, memory_per_row
+from render_pool import get_render_pool
+from metrics import span
+
+log = logging.getLogger(__name__)
+
+# pandas, the scraper (Selenium) and the chart renderers (matplotlib) are
+# imported on first use so the web app can import this module cheaply.
+_CHART_EXPORTS = ("get_city_coordinates", "report_unmapped", "render_india_map",
+                  "render_static_india_heatmap", "render_location_chart")
+
+def __getattr__(name):
+    if name in _CHART_EXPORTS:
+        import charts
+        return getattr(charts, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ----------- Location Normalization -----------
+@lru_cache(maxsize=4096)
 def normalize_location(location):
-    known_locations = {
-        "bangalore": "Bangalore",
-        "bengaluru": "Bangalore",
-        "mumbai": "Mumbai",
-        "delhi": "Delhi",
-        "pune": "Pune",
-        "noida": "Noida",
-        "hyderabad": "Hyderabad",
-        "chennai": "Chennai",
-        "gurgaon": "Gurgaon",
-        "kolkata": "Kolkata"
-    }
-
-    cleaned_location = location.lower().replace("/", " ")
-    cleaned_location = re.sub(r"[(),\-{}\[\]]", " ", cleaned_location)
-    cleaned_location = re.sub(r"\s+", " ", cleaned_location).strip()
-    words = cleaned_location.split()
-
-    for word in words:
-        if word in known_locations:
-            return known_locations[word]
-
-    return words[0].capitalize() if words else location.title()
-
+    """Canonical city name for one raw location, via the shared gazetteer"""
+    return GAZETTEER.normalize(location)
 
 def expand_locations(df):
-    rows = []
-    for _, row in df.iterrows():
-        locations = str(row['Location']).split(',')
-        for loc in locations:
-            new_row = row.copy()
-            new_row['Location'] = normalize_location(loc.strip())
-            rows.append(new_row)
-    return pd.DataFrame(rows)
-
-# ----------- India Map Heatmap Generation -----------
-def get_city_coordinates():
-    """Return coordinates for major Indian cities"""
-    return {
-        'Mumbai': (19.0760, 72.8777),
-        'Delhi': (28.7041, 77.1025),
-        'Bangalore': (12.9716, 77.5946),
-        'Hyderabad': (17.3850, 78.4867),
-        'Chennai': (13.0827, 80.2707),
-        'Kolkata': (22.5726, 88.3639),
-        'Pune': (18.5204, 73.8567),
-        'Ahmedabad': (23.0225, 72.5714),
-        'Jaipur': (26.9124, 75.7873),
-        'Surat': (21.1702, 72.8311),
-        'Lucknow': (26.8467, 80.9462),
-        'Kanpur': (26.4499, 80.3319),
-        'Nagpur': (21.1458, 79.0882),
-        'Indore': (22.7196, 75.8577),
-        'Thane': (19.2183, 72.9781),
-        'Bhopal': (23.2599, 77.4126),
-        'Visakhapatnam': (17.6868, 83.2185),
-        'Pimpri': (18.6298, 73.7997),
-        'Patna': (25.5941, 85.1376),
-        'Vadodara': (22.3072, 73.1812),
-        'Ghaziabad': (28.6692, 77.4538),
-        'Ludhiana': (30.9010, 75.8573),
-        'Agra': (27.1767, 78.0081),
-        'Nashik': (19.9975, 73.7898),
-        'Faridabad': (28.4089, 77.3178),
-        'Meerut': (28.9845, 77.7064),
-        'Rajkot': (22.3039, 70.8022),
-        'Kalyan': (19.2437, 73.1355),
-        'Vasai': (19.4916, 72.8054),
-        'Varanasi': (25.3176, 82.9739),
-        'Srinagar': (34.0837, 74.7973),
-        'Aurangabad': (19.8762, 75.3433),
-        'Dhanbad': (23.7957, 86.4304),
-        'Amritsar': (31.6340, 74.8723),
-        'Allahabad': (25.4358, 81.8463),
-        'Ranchi': (23.3441, 85.3096),
-        'Howrah': (22.5958, 88.2636),
-        'Coimbatore': (11.0168, 76.9558),
-        'Jabalpur': (23.1815, 79.9864),
-        'Gwalior': (26.2183, 78.1828),
-        'Vijayawada': (16.5062, 80.6480),
-        'Jodhpur': (26.2389, 73.0243),
-        'Madurai': (9.9252, 78.1198),
-        'Raipur': (21.2514, 81.6296),
-        'Kota': (25.2138, 75.8648),
-        'Gurgaon': (28.4595, 77.0266),
-        'Noida': (28.5355, 77.3910),
-        'Chandigarh': (30.7333, 76.7794),
-        'Mysore': (12.2958, 76.6394),
-        'Bareilly': (28.3670, 79.4304),
-        'Aligarh': (27.8974, 78.0880),
-        'Tiruchirappalli': (10.7905, 78.7047),
-        'Bhubaneswar': (20.2961, 85.8245),
-        'Salem': (11.6643, 78.1460),
-        'Thiruvananthapuram': (8.5241, 76.9366),
-        'Bhilai': (21.1938, 81.3509),
-        'Cuttack': (20.4625, 85.8828)
-    }
+    """One row per comma-separated location, with normalized location names.
 
+    The split/explode is vectorized and ``normalize_location`` runs once per
+    distinct raw location rather than once per row.
+    """
+    import pandas as pd
+
+    if df.empty:
+        return pd.DataFrame()
+
+    locations = df['Location'].map(str).str.split(',')
+    expanded = df.assign(Location=locations).explode('Location')
+    raw = expanded['Location'].str.strip()
+    normalized = {loc: normalize_location(loc) for loc in raw.unique()}
+    return expanded.assign(Location=raw.map(normalized))[df.columns]
+
+# ----------- Location Charts -----------
+# Renderers live in charts.py and take {location: count} mappings; these
+# wrappers keep the DataFrame-based API and write next to the working dir.
 def create_india_map_heatmap(df, job_title):
     """Create a heatmap on India map showing job distribution"""
-    try:
-        import folium
-        from folium.plugins import HeatMap
-        import numpy as np
-        
-        # Get location counts
-        location_counts = df['Location'].value_counts()
-        city_coords = get_city_coordinates()
-        
-        # Create base map centered on India
-        india_map = folium.Map(
-            location=[20.5937, 78.9629],  # Center of India
-            zoom_start=5,
-            tiles='OpenStreetMap'
-        )
-        
-        # Prepare data for heatmap
-        heat_data = []
-        marker_data = []
-        
-        for location, count in location_counts.items():
-            if location in city_coords:
-                lat, lon = city_coords[location]
-                # Add multiple points based on job count for better heatmap intensity
-                intensity = min(count, 50)  # Cap intensity for better visualization
-                for _ in range(intensity):
-                    heat_data.append([lat, lon, 1])
-                marker_data.append([lat, lon, location, count])
-        
-        # Add heatmap layer
-        if heat_data:
-           gradient = {'0.2': 'blue', '0.4': 'lime', '0.6': 'orange', '1.0': 'red'}
-           HeatMap(heat_data, radius=15, blur=10, gradient=gradient).add_to(india_map)
-
-        
-        # Add markers with job counts
-        for lat, lon, location, count in marker_data:
-            folium.CircleMarker(
-                location=[lat, lon],
-                radius=min(count/2 + 5, 20),  # Size based on job count
-                popup=f'<b>{location}</b><br>{count} jobs',
-                tooltip=f'{location}: {count} jobs',
-                color='darkred',
-                fill=True,
-                fillColor='red',
-                fillOpacity=0.7
-            ).add_to(india_map)
-        
-        # Save the map
-        map_file = f"{job_title.replace(' ', '_')}_india_heatmap.html"
-        india_map.save(map_file)
-        
-        # print(f"🗺️ India map heatmap generated: {map_file}")
-        return map_file
-        
-    except ImportError:
-        print("❌ Folium not installed. Installing folium for map generation...")
-        print("Please run: pip install folium")
-        return None
+    from charts import render_india_map
+    map_file = f"{job_title.replace(' ', '_')}_india_heatmap.html"
+    return render_india_map(JobAggregates.from_frame(df).locations(), job_title, map_file)
 
 def create_static_india_heatmap(df, job_title):
     """Create a static heatmap on India map using matplotlib"""
-    try:
-        import numpy as np
-        from matplotlib.patches import Circle
-        
-        # Get location counts and coordinates
-        location_counts = df['Location'].value_counts()
-        city_coords = get_city_coordinates()
-        
-        # Create figure
-        plt.figure(figsize=(15, 12))
-        
-        # India boundary coordinates (simplified)
-        india_boundary = {
-            'lat_min': 6, 'lat_max': 37,
-            'lon_min': 68, 'lon_max': 98
-        }
-        
-        # Create the plot
-        ax = plt.gca()
-        ax.set_xlim(india_boundary['lon_min'], india_boundary['lon_max'])
-        ax.set_ylim(india_boundary['lat_min'], india_boundary['lat_max'])
-        
-        # Plot cities with job counts
-        max_jobs = location_counts.max() if len(location_counts) > 0 else 1
-        
-        for location, count in location_counts.items():
-            if location in city_coords:
-                lat, lon = city_coords[location]
-                
-                # Calculate size and color based on job count
-                size = (count / max_jobs) * 500 + 50
-                color_intensity = count / max_jobs
-                
-                # Plot circle
-                circle = Circle((lon, lat), radius=0.5, 
-                              alpha=0.6 + 0.4 * color_intensity,
-                              color=plt.cm.YlOrRd(color_intensity))
-                ax.add_patch(circle)
-                
-                # Add city name and count
-                plt.annotate(f'{location}\n({count})', 
-                           (lon, lat), 
-                           xytext=(5, 5), 
-                           textcoords='offset points',
-                           fontsize=8,
-                           bbox=dict(boxstyle='round,pad=0.3', 
-                                   facecolor='white', 
-                                   alpha=0.8))
-        
-        # Styling
-        plt.title(f'{job_title} Jobs Distribution Across India', 
-                 fontsize=16, fontweight='bold', pad=20)
-        plt.xlabel('Longitude', fontsize=12)
-        plt.ylabel('Latitude', fontsize=12)
-        plt.grid(True, alpha=0.3)
-        
-        # Add a colorbar
-        sm = plt.cm.ScalarMappable(cmap=plt.cm.YlOrRd, 
-                                  norm=plt.Normalize(vmin=0, vmax=max_jobs))
-        sm.set_array([])
-        cbar = plt.colorbar(sm, ax=ax, shrink=0.6)
-        cbar.set_label('Number of Jobs', rotation=270, labelpad=20)
-        
-        plt.tight_layout()
-        
-        # Save the static heatmap
-        static_map_file = f"{job_title.replace(' ', '_')}_static_india_heatmap.png"
-        plt.savefig(static_map_file, dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
-        
-        # print(f"🗺️ Static India heatmap generated: {static_map_file}")
-        return static_map_file
-        
-    except Exception as e:
-        print(f"❌ Error creating static heatmap: {e}")
-        return None
+    from charts import render_static_india_heatmap
+    static_map_file = f"{job_title.replace(' ', '_')}_static_india_heatmap.png"
+    return render_static_india_heatmap(JobAggregates.from_frame(df).locations(), job_title, static_map_file)
 
 def create_location_heatmap(df, job_title):
     """Create a bar chart showing job distribution by location"""
-    
-    # Count jobs by location
-    location_counts = df['Location'].value_counts().head(15)
-    
-    plt.figure(figsize=(14, 8))
-    
-    # Create horizontal bar chart for better readability
-    bars = plt.barh(range(len(location_counts)), location_counts.values, 
-                    color=plt.cm.viridis(np.linspace(0, 1, len(location_counts))))
-    
-    # Customize the plot
-    plt.yticks(range(len(location_counts)), location_counts.index)
-    plt.xlabel('Number of Jobs', fontsize=12, fontweight='bold')
-    plt.title(f'{job_title} Jobs Distribution - Top 15 Locations', 
-              fontsize=16, fontweight='bold', pad=20)
-    
-    # Add value labels on bars
-    for i, (bar, value) in enumerate(zip(bars, location_counts.values)):
-        plt.text(value + max(location_counts.values) * 0.01, i, 
-                str(value), va='center', fontweight='bold')
-    
-    plt.grid(axis='x', alpha=0.3)
-    plt.tight_layout()
-    
-    # Save the chart
+    from charts import render_location_chart
     chart_file = f"{job_title.replace(' ', '_')}_location_chart.png"
-    plt.savefig(chart_file, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
-    
-    # print(f"📊 Location chart generated: {chart_file}")
-    return chart_file
+    return render_location_chart(JobAggregates.from_frame(df).locations(), job_title, chart_file)
 
 # ----------- Main HTML Report Generation -----------
-def generate_html_report(job_title="PCB Design", pages=2, create_heatmap=True):
-    df = get_naukri_jobs(job_title, pages=pages)
-    if df.empty:
-        print("No jobs found.")
-        return
+REPORT_COLUMNS = ['Job Title', 'Location', 'Experience', 'Description']
 
-    df = expand_locations(df)
+JOB_FRESHNESS = int(os.environ.get("JOB_FRESHNESS", 7 * 24 * 3600))
 
-    # Generate heatmaps if requested
-    heatmap_files = []
-    if create_heatmap:
-        print("\n📈 Generating location visualizations...")
-        
-        # Create India map heatmap (interactive)
-        india_map_file = create_india_map_heatmap(df, job_title)
-        if india_map_file:
-            heatmap_files.append(india_map_file)
-        
-        # Create static India heatmap
-        static_map_file = create_static_india_heatmap(df, job_title)
-        if static_map_file:
-            heatmap_files.append(static_map_file)
-        
-        # Create location bar chart
-        chart_file = create_location_heatmap(df, job_title)
-        if chart_file:
-            heatmap_files.append(chart_file)
+def collect_jobs(job_title, pages=2, progress=None, locations_file=None, store=None):
+    """Scrape ``job_title``; returns ``(df, aggregates)``.
 
-    # Select and rename only required columns
-    df_display = df[['Job Title', 'Location', 'Experience', 'Description']]
-    
-    # Generate location summary
-    location_summary = df['Location'].value_counts().head(10)
-    summary_html = "<h2>Top 10 Locations by Job Count</h2><ul>"
-    for location, count in location_summary.items():
-        summary_html += f"<li><strong>{location}</strong>: {count} jobs</li>"
-    summary_html += "</ul>"
+    ``df`` has one row per job location in the compact schema from
+    ``job_schema`` and ``aggregates`` is its ``JobAggregates`` summary.
+    ``locations_file``, if given, receives the summary as JSON so charts
+    can be rendered later without re-scraping. With a job ``store`` the
+    scrape is incremental and the rows come from every stored posting for
+    the role seen within ``JOB_FRESHNESS`` seconds.
+    """
+    from naukri_scrape import get_naukri_jobs
+
+    progress = progress or (lambda message: None)
+
+    progress("scraping")
+    df = get_naukri_jobs(job_title, pages=pages, store=store, incremental=store is not None)
+    if store is not None:
+        df = store.query(role=job_title, max_age=JOB_FRESHNESS)
+    if df.empty:
+        return df, JobAggregates(normalize_location)
 
-    html_content = f"""
+    progress("expanding locations")
+    with span("normalize"):
+        df = compact_jobs(expand_locations(df))
+        aggregates = JobAggregates.from_frame(df, role=job_title, normalize=normalize_location)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("🧮 %d job rows, %.0f bytes/row", len(df), memory_per_row(df))
+
+    if locations_file:
+        with open(locations_file, "w", encoding="utf-8") as f:
+            json.dump(aggregates.to_dict(job_title), f)
+    return df, aggregates
+
+def report_head(job_title):
+    """Opening HTML of a report; needs no job data so it can be sent immediately"""
+    title = html.escape(job_title)
+    return f"""
     <html>
     <head>
-        <title>{job_title} Jobs Report</title>
+        <title>{title} Jobs Report</title>
         <style>
             body {{ font-family: Arial, sans-serif; margin: 40px; background-color: #f9f9f9; }}
             h1 {{ color: #333; text-align: center; }}
@@ -339,41 +131,222 @@ def generate_html_report(job_title="PCB Design", pages=2, create_heatmap=True):
         </style>
     </head>
     <body>
-        <h1>{job_title} Jobs Report</h1>
-        
+        <h1>{title} Jobs Report</h1>
+        """
+
+REPORT_TAIL = """
+    </body>
+    </html>
+    """
+
+def iter_report_body(df, heatmap_files=None, chart_links=None, chunk_rows=500, aggregates=None):
+    """Yield the stats, summary and job table, ``chunk_rows`` table rows at a time
+
+    Counts come from ``aggregates`` (built from ``df`` if not given).
+    """
+    heatmap_files = heatmap_files or []
+    aggregates = aggregates or JobAggregates.from_frame(df)
+
+    # Generate location summary
+    summary_html = "<h2>Top 10 Locations by Job Count</h2><ul>"
+    for location, count in aggregates.top_locations(10):
+        summary_html += f"<li><strong>{html.escape(str(location))}</strong>: {count} jobs</li>"
+    summary_html += "</ul>"
+    if aggregates.experience:
+        summary_html += "<h2>Minimum Experience</h2><ul>"
+        for label, count in aggregates.experience_histogram():
+            summary_html += f"<li><strong>{label}</strong>: {count} jobs</li>"
+        summary_html += "</ul>"
+
+    yield f"""
         <div class="stats">
             <div class="stat-box">
                 <h3>Total Jobs Found</h3>
-                <p style="font-size: 24px; margin: 0;">{len(df)}</p>
+                <p style="font-size: 24px; margin: 0;">{aggregates.total}</p>
             </div>
             <div class="stat-box">
                 <h3>Unique Locations</h3>
-                <p style="font-size: 24px; margin: 0;">{df['Location'].nunique()}</p>
+                <p style="font-size: 24px; margin: 0;">{len(aggregates.location_counts)}</p>
             </div>
         </div>
         
         {"<div class='heatmap-info'><strong>📊 Heatmap files generated:</strong><br>" + "<br>".join([f"• {file}" for file in heatmap_files]) + "</div>" if heatmap_files else ""}
+        {"<div class='heatmap-info'><strong>📊 Location charts:</strong><br>" + "<br>".join([f"• <a href='{html.escape(url)}'>{label}</a>" for label, url in chart_links]) + "</div>" if chart_links else ""}
         
         <div class="summary">
             {summary_html}
         </div>
         
         <h2>Detailed Job Listings</h2>
-        {df_display.to_html(index=False, escape=False)}
-    </body>
-    </html>
+        <table border="1" class="dataframe">
+          <thead>
+            <tr style="text-align: right;">
+              {"".join(f"<th>{column}</th>" for column in REPORT_COLUMNS)}
+            </tr>
+          </thead>
+          <tbody>
+"""
+
+    # Select only required columns and stream the rows
+    df_display = df[REPORT_COLUMNS]
+    for start in range(0, len(df_display), chunk_rows):
+        chunk = df_display.iloc[start:start + chunk_rows]
+        yield "".join(
+            "<tr>" + "".join(f"<td>{html.escape(str(value))}</td>" for value in row) + "</tr>\n"
+            for row in chunk.itertuples(index=False, name=None)
+        )
+
+    yield """          </tbody>
+        </table>"""
+
+def iter_html_report(df, job_title, heatmap_files=None, chart_links=None, chunk_rows=500,
+                     aggregates=None):
+    """Yield a complete HTML report in chunks"""
+    yield report_head(job_title)
+    yield from iter_report_body(df, heatmap_files, chart_links, chunk_rows, aggregates)
+    yield REPORT_TAIL
+
+def generate_html_report(job_title="PCB Design", pages=2, create_heatmap=True, progress=None,
+                         output_file=None, locations_file=None, chart_links=None, store=None):
+    """Scrape ``job_title`` and write the HTML report; returns its filename.
+
+    ``output_file`` defaults to ``<job_title>_report.html`` in the working
+    directory. ``locations_file``, if given, receives the per-location job
+    counts as JSON so charts can be rendered later without re-scraping, and
+    ``chart_links`` is a list of ``(label, url)`` pairs linked from the report.
+    ``store`` is passed on to ``collect_jobs``.
+
+    ``progress`` is an optional callback that receives a short status string
+    as each stage starts.
     """
+    progress = progress or (lambda message: None)
 
-    output_file = f"{job_title.replace(' ', '_')}_report.html"
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    df, aggregates = collect_jobs(job_title, pages, progress, locations_file, store)
+    if df.empty:
+        log.info("No jobs found.")
+        return
 
-    print(f"\n✅ Report generated: {output_file}")
+    # Generate heatmaps if requested
+    heatmap_files = []
+    if create_heatmap:
+        progress("rendering charts")
+        log.info("📈 Generating location visualizations...")
+        
+        # Interactive map, static map and bar chart render in parallel worker processes
+        location_counts = aggregates.locations()
+        prefix = job_title.replace(' ', '_')
+        timings = get_render_pool().render_many([
+            ("map", location_counts, job_title, f"{prefix}_india_heatmap.html", None),
+            ("map.png", location_counts, job_title, f"{prefix}_static_india_heatmap.png", 300),
+            ("chart.png", location_counts, job_title, f"{prefix}_location_chart.png", 300),
+        ])
+        heatmap_files = [timing["file"] for timing in timings if timing["file"]]
+
+    progress("writing report")
+    output_file = output_file or f"{job_title.replace(' ', '_')}_report.html"
+    with span("write"), open(output_file, "w", encoding="utf-8") as f:
+        for chunk in iter_html_report(df, job_title, heatmap_files, chart_links,
+                                      aggregates=aggregates):
+            f.write(chunk)
+
+    log.info("✅ Report generated: %s", output_file)
     if heatmap_files:
-        print(f"📊 Heatmap files: {', '.join(heatmap_files)}")
+        log.info("📊 Heatmap files: %s", ", ".join(heatmap_files))
+    return output_file
+
+# ----------- Batch Reports -----------
+def combine_location_counts(role_counts):
+    """Cross-role location summary from ``{role: {location: count}}``.
+
+    Returns one entry per location, busiest first, with the total and the
+    per-role breakdown.
+    """
+    combined = {}
+    for role, counts in role_counts.items():
+        for location, count in counts.items():
+            entry = combined.setdefault(location, {"location": location, "total": 0, "roles": {}})
+            entry["total"] += count
+            entry["roles"][role] = count
+    return sorted(combined.values(), key=lambda entry: entry["total"], reverse=True)
+
+def iter_batch_summary(summary, reports):
+    """Yield the combined location summary page; ``reports`` maps role to report link"""
+    roles = list(reports)
+    yield report_head("Cross-role")
+    yield "<h2>Reports</h2><ul>"
+    for role, link in reports.items():
+        label = html.escape(role)
+        yield f"<li><a href='{html.escape(link)}'>{label}</a></li>" if link else f"<li>{label}: no jobs found</li>"
+    yield "</ul><h2>Jobs by Location Across Roles</h2><table border='1' class='dataframe'><thead><tr>"
+    yield "".join(f"<th>{html.escape(column)}</th>" for column in ["Location", "Total"] + roles)
+    yield "</tr></thead><tbody>\n"
+    for entry in summary:
+        cells = [entry["location"], entry["total"]] + [entry["roles"].get(role, 0) for role in roles]
+        yield "<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in cells) + "</tr>\n"
+    yield "</tbody></table>" + REPORT_TAIL
+
+def generate_batch_reports(requests, create_heatmap=True, max_parallel=None, store=None,
+                           summary_file="batch_summary.html"):
+    """Generate one report per ``(job_title, pages)`` plus a combined location summary.
+
+    Roles run concurrently, but every page fetch still goes through the
+    shared crawl scheduler, so total concurrency and per-host pacing are
+    the same as for a single report. Returns ``{job_title: report_file}``.
+    """
+    started = time.perf_counter()
+
+    def run(request):
+        job_title, pages = request
+        locations_file = f"{job_title.replace(' ', '_')}_locations.json"
+        report = generate_html_report(job_title=job_title, pages=pages,
+                                      create_heatmap=create_heatmap,
+                                      locations_file=locations_file, store=store)
+        return report, locations_file
+
+    with ThreadPoolExecutor(max_workers=max_parallel or len(requests) or 1,
+                            thread_name_prefix="batch") as executor:
+        results = list(executor.map(run, requests))
+
+    reports, role_counts = {}, {}
+    for (job_title, _), (report, locations_file) in zip(requests, results):
+        reports[job_title] = report
+        if report:
+            with open(locations_file, encoding="utf-8") as f:
+                role_counts[job_title] = json.load(f)["locations"]
+
+    with open(summary_file, "w", encoding="utf-8") as f:
+        for chunk in iter_batch_summary(combine_location_counts(role_counts), reports):
+            f.write(chunk)
+
+    log.info("✅ Batch of %d roles done in %.1fs; summary: %s",
+             len(requests), time.perf_counter() - started, summary_file)
+    return reports
+
+def parse_batch_role(value, default_pages):
+    """``"Data Scientist:3"`` -> ``("Data Scientist", 3)``; the page count is optional"""
+    role, sep, pages = value.rpartition(":")
+    if sep and pages.strip().isdigit():
+        return role.strip(), int(pages)
+    return value.strip(), default_pages
 
 # ----------- Run Script -----------
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(), format="%(message)s")
+
+    if len(sys.argv) > 1:
+        parser = argparse.ArgumentParser(description="Generate job reports for several roles at once")
+        parser.add_argument("roles", nargs="+", help="roles, optionally with a page count: 'Data Scientist:3'")
+        parser.add_argument("--pages", type=int, default=2, help="pages per role without an explicit count")
+        parser.add_argument("--parallel", type=int, default=None, help="roles processed at once")
+        parser.add_argument("--no-heatmap", action="store_true", help="skip chart rendering")
+        parser.add_argument("--summary", default="batch_summary.html", help="combined summary file")
+        args = parser.parse_args()
+
+        generate_batch_reports([parse_batch_role(role, args.pages) for role in args.roles],
+                               create_heatmap=not args.no_heatmap, max_parallel=args.parallel,
+                               summary_file=args.summary)
+        sys.exit()
+
     job_title = input("Enter job title (e.g., PCB Design): ").strip()
     pages = int(input("Enter number of pages to scrape (e.g., 2): ").strip())
     create_heatmap = input("Generate location heatmap? (y/n, default: y): ").strip().lower()
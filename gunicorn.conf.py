@@ -0,0 +1,33 @@
+"""Gunicorn settings, picked up automatically from the working directory."""
+import os
+import importlib
+
+# Heavy libraries the app only imports on first use. With GUNICORN_PRELOAD=1
+# the master loads the app and these before forking, so workers share them
+# copy-on-write instead of each paying for the imports on its first scrape.
+PRELOAD_MODULES = ("pandas", "requests", "lxml.html", "selenium.webdriver",
+                   "selenium.webdriver.support.ui")
+
+preload_app = os.environ.get("GUNICORN_PRELOAD") == "1"
+
+# Streamed reports and /jobs/stream hold a connection for the whole crawl. Threaded
+# workers keep serving health checks and other routes meanwhile, and since the
+# worker heartbeat runs on its own thread, a long stream is not a WORKER TIMEOUT.
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
+
+
+def post_worker_init(worker):
+    # Each worker keeps its own search index; load it before the first /search
+    from gen_map2 import normalize_location
+    from search_index import warm_search_index
+    warm_search_index(normalize_location)
+
+
+def when_ready(server):
+    # Runs in the master after the app is loaded and before workers are forked
+    if preload_app:
+        for name in PRELOAD_MODULES:
+            importlib.import_module(name)
+        server.log.info("Preloaded %s", ", ".join(PRELOAD_MODULES))
@@ -0,0 +1,59 @@
+import time
+import threading
+
+from driver_pool import DriverPoolError, DriverPoolTimeout
+
+
+class BrowserChecker:
+    """Background probe of Chrome availability with a cached result.
+
+    Every ``interval`` seconds the checker borrows a driver from the pool
+    without waiting and pings it. An idle warm driver makes this a single
+    round trip; a cold pool launches one driver, which then stays warm for
+    scrapes. When every driver is checked out the browser is clearly
+    working, so the check counts as a pass.
+    """
+
+    def __init__(self, get_pool, interval=60):
+        self.get_pool = get_pool
+        self.interval = interval
+
+        self._lock = threading.Lock()
+        self._thread = None
+        self._result = {"available": None, "state": "unknown", "checked_at": None}
+
+    def start(self):
+        """Start the background thread once; later calls are no-ops"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="browser-check", daemon=True)
+                self._thread.start()
+
+    def result(self):
+        with self._lock:
+            return dict(self._result)
+
+    def check(self):
+        start = time.monotonic()
+        pool = self.get_pool()
+        try:
+            with pool.driver(timeout=0) as driver:
+                driver.execute_script("return 1")
+            result = {"available": True, "state": "available"}
+        except DriverPoolTimeout:
+            result = {"available": True, "state": "busy"}
+        except DriverPoolError as e:
+            result = {"available": False, "state": "unavailable", "error": str(e)}
+        except Exception as e:
+            result = {"available": False, "state": "unavailable", "error": type(e).__name__}
+
+        result["checked_at"] = time.time()
+        result["duration"] = round(time.monotonic() - start, 3)
+        with self._lock:
+            self._result = result
+        return result
+
+    def _loop(self):
+        while True:
+            self.check()
+            time.sleep(self.interval)
@@ -0,0 +1,67 @@
+import os
+import threading
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Shared keep-alive session with a pooled connection adapter"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            pool_size = int(os.environ.get("HTTP_POOL_SIZE", 10))
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({
+                "User-Agent": USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+                "Connection": "keep-alive",
+            })
+            _session = session
+        return _session
+
+
+def fetch_page(url, timeout=15):
+    """GET a results page and return its HTML"""
+    response = get_session().get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+def parse_cards(page_html, card_xpath, fields, base_url=None):
+    """Parse job cards out of raw HTML using the scraper's XPath selectors.
+
+    ``fields`` has the same ``(name, xpath, attr)`` shape as
+    ``naukri_scrape.CARD_FIELDS``; missing fields become "N/A".
+    """
+    from lxml import html as lxml_html
+
+    if not page_html.strip():
+        return []
+    doc = lxml_html.fromstring(page_html)
+    if base_url:
+        doc.make_links_absolute(base_url)
+
+    records = []
+    for card in doc.xpath(card_xpath):
+        record = {}
+        for name, xpath, attr in fields:
+            nodes = card.xpath(xpath)
+            if not nodes:
+                record[name] = "N/A"
+            elif attr:
+                value = nodes[0].get(attr)
+                record[name] = "N/A" if value is None else value
+            else:
+                record[name] = " ".join(nodes[0].text_content().split())
+        records.append(record)
+    return records
@@ -0,0 +1,96 @@
+"""Summary counts for a result set, built once and updated per job.
+
+A ``JobAggregates`` holds jobs per location, a histogram of minimum
+experience and jobs per role. ``from_frame`` builds it from a
+compact expanded frame in one vectorized pass. ``add`` folds in a single
+scraped record, touching only that job's own locations. Every summary,
+chart and locations file reads from it instead of recounting the frame.
+"""
+import heapq
+
+from gazetteer import GAZETTEER
+from job_schema import jobs_per_location, parse_experience
+
+
+class JobAggregates:
+    """Running totals for one result set.
+
+    ``location_counts`` maps a normalized location to its job count,
+    ``experience`` maps minimum years (None when unparseable) to job
+    counts and ``roles`` maps a role to its job count. ``normalize`` turns
+    one raw location into its canonical name.
+    """
+
+    def __init__(self, normalize=None):
+        self.normalize = normalize or GAZETTEER.normalize
+        self.total = 0
+        self.location_counts = {}
+        self.experience = {}
+        self.roles = {}
+
+    @classmethod
+    def from_frame(cls, df, role=None, normalize=None):
+        """Aggregate an ``expand_locations`` frame (one posting per index label)"""
+        import pandas as pd
+
+        aggregates = cls(normalize)
+        if df.empty:
+            return aggregates
+
+        postings = df[~df.index.duplicated()]
+        aggregates.total = len(postings)
+        aggregates.location_counts = jobs_per_location(df).to_dict()
+        if "Experience Min" in postings:
+            for years, count in postings["Experience Min"].value_counts(dropna=False).items():
+                aggregates.experience[None if pd.isna(years) else int(years)] = int(count)
+        if role is not None:
+            aggregates.roles[role] = aggregates.total
+        return aggregates
+
+    def add(self, record, role=None):
+        """Count one raw scraped record; returns its normalized locations"""
+        self.total += 1
+        locations = [self.normalize(raw.strip()) for raw in str(record.get("Location", "")).split(",")]
+        for location in locations:
+            self.location_counts[location] = self.location_counts.get(location, 0) + 1
+        low, _ = parse_experience(record.get("Experience"))
+        self.experience[low] = self.experience.get(low, 0) + 1
+        if role is not None:
+            self.roles[role] = self.roles.get(role, 0) + 1
+        return locations
+
+    def merge(self, other):
+        """Fold another result set's totals into this one"""
+        self.total += other.total
+        for target, source in ((self.location_counts, other.location_counts),
+                               (self.experience, other.experience),
+                               (self.roles, other.roles)):
+            for key, count in source.items():
+                target[key] = target.get(key, 0) + count
+        return self
+
+    # ----------- Views -----------
+    def locations(self):
+        """``{location: count}``, busiest first, as the chart renderers expect"""
+        return dict(sorted(self.location_counts.items(), key=lambda item: item[1], reverse=True))
+
+    def top_locations(self, n=10):
+        return heapq.nlargest(n, self.location_counts.items(), key=lambda item: item[1])
+
+    def experience_histogram(self):
+        """``[(label, count)]`` by minimum years, unparseable last"""
+        known = sorted((years, count) for years, count in self.experience.items() if years is not None)
+        histogram = [(f"{years}+ yrs", count) for years, count in known]
+        if None in self.experience:
+            histogram.append(("Not stated", self.experience[None]))
+        return histogram
+
+    def to_dict(self, job_title=None):
+        """JSON-ready summary; ``locations`` keeps the locations-file shape"""
+        return {
+            "job_title": job_title,
+            "total": self.total,
+            "locations": self.locations(),
+            "experience": dict(self.experience_histogram()),
+            "roles": dict(self.roles),
+        }
@@ -0,0 +1,72 @@
+"""Compact typed schema for scraped job frames.
+
+Scraped rows arrive as object-dtype strings. ``compact_jobs`` turns them
+into the frame the rest of the pipeline consumes:
+
+* ``Job Title``, ``Location`` and ``Experience`` are categoricals, since a
+  crawl repeats a small set of titles, cities and ranges;
+* ``Experience Min`` / ``Experience Max`` hold the parsed range in years as
+  nullable small integers (open-ended "5+ Yrs" has no max);
+* ``Job URL`` strings are interned, so rows that ``expand_locations``
+  multiplies, or postings seen again in another crawl, share one object.
+
+pandas is imported on first use, like in ``gen_map2``.
+"""
+import re
+import sys
+
+CATEGORICAL_COLUMNS = ("Job Title", "Location", "Experience")
+EXPERIENCE_COLUMNS = ("Experience Min", "Experience Max")
+
+_EXPERIENCE = re.compile(r"(\d+)\s*(?:-|to)?\s*(\d+)?")
+
+
+def parse_experience(experience):
+    """``"3-6 Yrs"`` -> ``(3, 6)``, ``"5+ Yrs"`` -> ``(5, None)``, unparseable -> ``(None, None)``"""
+    match = _EXPERIENCE.search(str(experience or ""))
+    if not match:
+        return None, None
+    low = int(match.group(1))
+    high = int(match.group(2)) if match.group(2) else (None if "+" in experience else low)
+    return low, high
+
+
+def compact_jobs(df):
+    """Return ``df`` in the compact schema; already-compact columns are left as they are"""
+    import pandas as pd
+
+    if df.empty:
+        return df
+
+    columns = {}
+    for column in CATEGORICAL_COLUMNS:
+        if column in df and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            columns[column] = df[column].astype("category")
+
+    if "Experience" in df and "Experience Min" not in df:
+        experience = columns.get("Experience", df["Experience"])
+        # Parse each distinct range once, then broadcast through the category codes
+        parsed = [parse_experience(value) for value in experience.cat.categories]
+        codes = experience.cat.codes.to_numpy()
+        for i, column in enumerate(EXPERIENCE_COLUMNS):
+            values = pd.array([bounds[i] for bounds in parsed] + [None], dtype="Int16")
+            # Code -1 (missing) picks the trailing None
+            columns[column] = pd.Series(values.take(codes), index=df.index)
+
+    if "Job URL" in df and not isinstance(df["Job URL"].dtype, pd.CategoricalDtype):
+        columns["Job URL"] = df["Job URL"].map(sys.intern, na_action="ignore")
+
+    return df.assign(**columns)
+
+
+def jobs_per_location(df):
+    """Jobs per location, busiest first, without empty categories"""
+    counts = df["Location"].value_counts()
+    return counts[counts > 0]
+
+
+def memory_per_row(df):
+    """Bytes per row, counting the string payloads"""
+    if not len(df):
+        return 0.0
+    return df.memory_usage(deep=True).sum() / len(df)
@@ -0,0 +1,239 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+from gazetteer import GAZETTEER
+from job_schema import compact_jobs, parse_experience
+from report_jobs import normalize_role
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    location TEXT NOT NULL,
+    experience TEXT,
+    description TEXT,
+    exp_min INTEGER,
+    exp_max INTEGER,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen);
+
+CREATE TABLE IF NOT EXISTS job_roles (
+    role TEXT NOT NULL,
+    url TEXT NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (role, url)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS job_roles_freshness ON job_roles (role, last_seen);
+
+CREATE TABLE IF NOT EXISTS job_locations (
+    location TEXT NOT NULL,
+    url TEXT NOT NULL,
+    PRIMARY KEY (location, url)
+) WITHOUT ROWID;
+"""
+
+# Columns added after the first release, for migrating existing databases
+MIGRATIONS = {
+    "exp_min": "ALTER TABLE jobs ADD COLUMN exp_min INTEGER",
+    "exp_max": "ALTER TABLE jobs ADD COLUMN exp_max INTEGER",
+}
+
+FIELDS = ("title", "location", "experience", "description", "url",
+          "exp_min", "exp_max", "first_seen", "last_seen")
+
+COLUMNS = {
+    "title": "Job Title",
+    "location": "Location",
+    "experience": "Experience",
+    "description": "Description",
+    "url": "Job URL",
+}
+
+
+def job_key(record):
+    """Primary key of a scraped record: its URL, or a content hash if it has none"""
+    url = record.get("Job URL")
+    if url and url != "N/A":
+        return url
+    content = "|".join(str(record.get(column, "")) for column in COLUMNS.values())
+    return "nourl:" + hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class JobStore:
+    """SQLite (WAL) store of scraped postings keyed by Job URL.
+
+    Each posting keeps its first-seen and last-seen timestamps, the roles
+    it was found under and its normalized locations, so reports can be
+    built with indexed queries by role, location and freshness.
+    """
+
+    def __init__(self, path="jobs.db"):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, statement in MIGRATIONS.items():
+                if column not in existing:
+                    conn.execute(statement)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def known_keys(self, keys):
+        """The subset of ``keys`` already in the store"""
+        keys = list(keys)
+        conn = self._connect()
+        known = set()
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            rows = conn.execute(
+                f"SELECT url FROM jobs WHERE url IN ({','.join('?' * len(batch))})", batch)
+            known.update(url for (url,) in rows)
+        return known
+
+    def upsert(self, records, role):
+        """Insert or refresh scraped records in one transaction; returns how many were new"""
+        now = time.time()
+        role = normalize_role(role)
+        rows, roles, locations = [], [], []
+        for record in records:
+            key = job_key(record)
+            exp_min, exp_max = parse_experience(record.get("Experience"))
+            rows.append((key, record["Job Title"], record["Location"], record.get("Experience"),
+                         record.get("Description"), exp_min, exp_max, now, now))
+            roles.append((role, key, now))
+            for location in str(record["Location"]).split(","):
+                locations.append((GAZETTEER.normalize(location.strip()), key))
+
+        conn = self._connect()
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (url, title, location, experience, description, "
+                "exp_min, exp_max, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            new = conn.total_changes - before
+            conn.executemany(
+                "UPDATE jobs SET title = ?, location = ?, experience = ?, description = ?, "
+                "exp_min = ?, exp_max = ?, last_seen = ? WHERE url = ?",
+                [row[1:7] + (row[8], row[0]) for row in rows])
+            conn.executemany(
+                "INSERT INTO job_roles (role, url, last_seen) VALUES (?, ?, ?) "
+                "ON CONFLICT (role, url) DO UPDATE SET last_seen = excluded.last_seen", roles)
+            conn.executemany(
+                "INSERT OR IGNORE INTO job_locations (location, url) VALUES (?, ?)", locations)
+        return new
+
+    def get_jobs(self, keys):
+        """Stored postings by job key, as ``{key: dict of FIELDS}``"""
+        keys = list(keys)
+        conn = self._connect()
+        jobs = {}
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            rows = conn.execute(
+                "SELECT title, location, experience, description, url, exp_min, exp_max, "
+                f"first_seen, last_seen FROM jobs WHERE url IN ({','.join('?' * len(batch))})", batch)
+            for row in rows:
+                job = dict(zip(FIELDS, row))
+                if job["url"].startswith("nourl:"):
+                    job["url"] = "N/A"
+                jobs[row[4]] = job
+        return jobs
+
+    def changes_since(self, rowid=0, last_seen=0):
+        """``(rowid, key, job)`` for postings inserted after ``rowid`` or refreshed
+        after ``last_seen``, in insertion order; ``key`` is the raw job key"""
+        rows = self._connect().execute(
+            "SELECT rowid, title, location, experience, description, url, exp_min, exp_max, "
+            "first_seen, last_seen FROM jobs WHERE rowid > ? OR last_seen > ? ORDER BY rowid",
+            (rowid, last_seen))
+        for row in rows:
+            yield row[0], row[5], dict(zip(FIELDS, row[1:]))
+
+    def version(self):
+        """Cheap token that changes whenever postings are inserted or refreshed"""
+        row = self._connect().execute("SELECT MAX(rowid), MAX(last_seen) FROM jobs").fetchone()
+        return f"{row[0] or 0}:{row[1] or 0}"
+
+    def iter_jobs(self, role=None, location=None, since=None, exp_min=None, exp_max=None,
+                  after=None, limit=None):
+        """Stream stored postings as dicts of ``FIELDS``, freshest first.
+
+        ``location`` is a normalized city name, ``since`` a unix timestamp
+        (role-specific when ``role`` is given) and ``exp_min``/``exp_max``
+        keep postings whose experience range overlaps the requested one.
+        ``after`` is the ``(last_seen, url)`` of the previous page's last
+        row, for keyset pagination.
+        """
+        sql = ["SELECT j.title, j.location, j.experience, j.description, j.url, "
+               "j.exp_min, j.exp_max, j.first_seen, j.last_seen FROM jobs j"]
+        params, where, where_params = [], [], []
+        if role:
+            sql.append("JOIN job_roles r ON r.url = j.url AND r.role = ?")
+            params.append(normalize_role(role))
+        if location:
+            sql.append("JOIN job_locations l ON l.url = j.url AND l.location = ?")
+            params.append(location)
+        if since is not None:
+            where.append("r.last_seen >= ?" if role else "j.last_seen >= ?")
+            where_params.append(since)
+        if exp_min is not None:
+            # Open-ended ranges ("5+ Yrs") have no exp_max and reach any minimum
+            where.append("(j.exp_max >= ? OR (j.exp_max IS NULL AND j.exp_min IS NOT NULL))")
+            where_params.append(exp_min)
+        if exp_max is not None:
+            where.append("j.exp_min <= ?")
+            where_params.append(exp_max)
+        if after is not None:
+            where.append("(j.last_seen < ? OR (j.last_seen = ? AND j.url > ?))")
+            where_params.extend([after[0], after[0], after[1]])
+        if where:
+            sql.append("WHERE " + " AND ".join(where))
+            params.extend(where_params)
+        sql.append("ORDER BY j.last_seen DESC, j.url ASC")
+        if limit:
+            sql.append("LIMIT ?")
+            params.append(limit)
+
+        for row in self._connect().execute(" ".join(sql), params):
+            job = dict(zip(FIELDS, row))
+            if job["url"].startswith("nourl:"):
+                job["url"] = "N/A"
+            yield job
+
+    def query(self, role=None, location=None, max_age=None, limit=None):
+        """Stored postings as a compact scraper-shaped DataFrame, freshest first.
+
+        ``location`` is a normalized city name and ``max_age`` is in seconds.
+        """
+        import pandas as pd
+
+        since = time.time() - max_age if max_age is not None else None
+        rows = [[job[field] for field in COLUMNS]
+                for job in self.iter_jobs(role=role, location=location, since=since, limit=limit)]
+        return compact_jobs(pd.DataFrame(rows, columns=list(COLUMNS.values())))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_job_store():
+    """Return the process-wide job store, creating it on first use"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = JobStore(os.environ.get("JOB_STORE_PATH", "jobs.db"))
+        return _store
@@ -0,0 +1,136 @@
+"""Prometheus metrics and per-stage timing spans for the scrape/report pipeline.
+
+``span(stage)`` times a block into the ``pipeline_stage_seconds`` histogram.
+While a request is collecting a timing breakdown (``collect_timings``) the
+same durations are summed per stage for that request; the collector lives
+in a context variable, so it follows work handed to the crawl scheduler.
+Metrics are kept in this process's default registry.
+"""
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+
+STAGES = ("politeness", "backoff", "driver_acquire", "fetch", "wait", "extract", "normalize", "render", "write")
+
+STAGE_SECONDS = Histogram(
+    "pipeline_stage_seconds", "Time spent in each pipeline stage", ["stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+PAGES = Counter("scrape_pages_total", "Result pages scraped", ["backend", "status"])
+CARDS_PER_PAGE = Histogram(
+    "scrape_cards_per_page", "Job cards extracted from each successful result page",
+    buckets=(1, 5, 10, 15, 20, 25, 30, 40, 50, 100),
+)
+BLOCKS = Counter("scrape_blocks_total", "Result pages that were blocked or showed a captcha",
+                 ["backend"])
+PAGE_BYTES = Histogram(
+    "chrome_page_bytes", "Bytes transferred while rendering a result page in Chrome",
+    buckets=(50e3, 100e3, 250e3, 500e3, 1e6, 2e6, 5e6, 10e6),
+)
+PAGE_LOAD_SECONDS = Histogram(
+    "chrome_page_load_seconds", "Time to DOMContentLoaded for a result page in Chrome",
+    buckets=(0.1, 0.25, 0.5, 1, 2, 3, 5, 10, 20),
+)
+CACHE_REQUESTS = Counter("report_cache_requests_total", "Report cache lookups",
+                         ["artifact", "result"])
+CACHE_EVICTIONS = Counter("report_cache_evictions_total",
+                          "Report cache entries removed as expired or over the size limits",
+                          ["artifact"])
+
+
+class StageTimings:
+    """Per-stage totals for one request, safe to update from several threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals = {}
+
+    def add(self, stage, seconds):
+        with self._lock:
+            self.totals[stage] = self.totals.get(stage, 0.0) + seconds
+
+    def server_timing(self):
+        """``Server-Timing`` header value, in pipeline order"""
+        with self._lock:
+            totals = dict(self.totals)
+        order = [stage for stage in STAGES if stage in totals]
+        order += sorted(stage for stage in totals if stage not in STAGES)
+        return ", ".join(f"{stage};dur={totals[stage] * 1000:.1f}" for stage in order)
+
+    def merge_header(self, existing):
+        """``server_timing`` added to an existing header, replacing entries it also has"""
+        breakdown = self.server_timing()
+        if not existing:
+            return breakdown
+        with self._lock:
+            stages = set(self.totals)
+        kept = [entry.strip() for entry in existing.split(",")
+                if entry.strip() and entry.split(";")[0].strip() not in stages]
+        return ", ".join(kept + [breakdown])
+
+    def to_dict(self):
+        """Seconds per stage, rounded to the millisecond"""
+        with self._lock:
+            return {stage: round(seconds, 3) for stage, seconds in self.totals.items()}
+
+
+_timings = contextvars.ContextVar("stage_timings", default=None)
+
+
+def collect_timings(enabled=True):
+    """Start (or with ``enabled=False`` stop) collecting a breakdown in this context"""
+    timings = StageTimings() if enabled else None
+    _timings.set(timings)
+    return timings
+
+
+def current_timings():
+    return _timings.get()
+
+
+def resume_timings(timings):
+    """Collect into ``timings`` from another context, e.g. a worker thread or a
+    response generator that outlives its request"""
+    _timings.set(timings)
+
+
+def observe(stage, seconds):
+    """Record ``seconds`` spent in ``stage``"""
+    STAGE_SECONDS.labels(stage).observe(seconds)
+    timings = _timings.get()
+    if timings is not None:
+        timings.add(stage, seconds)
+
+
+@contextmanager
+def span(stage):
+    """Time the enclosed block as ``stage``, whether or not it raises"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(stage, time.perf_counter() - start)
+
+
+def record_page(backend, status, cards):
+    """Count one scraped result page and its outcome"""
+    PAGES.labels(backend, status).inc()
+    if status == "blocked":
+        BLOCKS.labels(backend).inc()
+    elif status == "ok":
+        CARDS_PER_PAGE.observe(cards)
+
+
+def record_page_weight(transferred, load_seconds):
+    """Record what one Chrome-rendered page cost to load"""
+    PAGE_BYTES.observe(transferred)
+    if load_seconds is not None:
+        PAGE_LOAD_SECONDS.observe(load_seconds)
+
+
+def exposition():
+    """``(body, content_type)`` for a ``/metrics`` response"""
+    return generate_latest(), CONTENT_TYPE_LATEST
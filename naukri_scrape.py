@@ -1,16 +1,28 @@
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import pandas as pd
-import time
-import random
-import chromedriver_binary
+import logging
+import threading
+from concurrent.futures import wait
+from chrome_profile import apply_lean_options, block_resources, page_weight
+from crawl_scheduler import get_scheduler, host_of
+from driver_pool import DriverPoolError, get_pool
+from wait_policy import get_wait_policy
+from http_fetch import fetch_page, parse_cards
+from job_schema import compact_jobs
+from job_store import job_key
+from metrics import record_page, record_page_weight, span
+
+log = logging.getLogger(__name__)
+
+# Selenium, pandas and requests are imported where they are used, so that
+# importing this module (e.g. from the web app) stays cheap until a page is
+# actually scraped.
+
 def setup_chrome_driver():
     """Setup Chrome driver for Render deployment"""
+    import chromedriver_binary  # noqa: F401  (puts chromedriver on PATH)
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    
     options = Options()
     
     # Essential headless options for server deployment
@@ -20,8 +32,9 @@ def setup_chrome_driver():
     options.add_argument('--disable-gpu')
     options.add_argument('--disable-extensions')
     options.add_argument('--disable-plugins')
-    options.add_argument('--disable-images')  # Faster loading
-    options.add_argument('--disable-javascript')  # If not needed
+    
+    # Request blocking, eager page loads and the shared disk cache
+    apply_lean_options(options)
     
     # Window and memory settings
     options.add_argument('--window-size=1920,1080')
@@ -45,125 +58,345 @@ def setup_chrome_driver():
         
         # Additional anti-detection
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        block_resources(driver)
         
         return driver
     except Exception as e:
-        print(f"❌ Chrome setup failed: {e}")
+        log.error("❌ Chrome setup failed: %s", e)
         return None
 
-def get_naukri_jobs(query, pages=1):
-    """Scrape Naukri jobs with proper error handling for Render"""
-    driver = setup_chrome_driver()
-    if not driver:
-        print("❌ Failed to setup Chrome driver")
-        return pd.DataFrame()
+# ----------- Card Selectors -----------
+CARD_XPATH = '//div[contains(@class, "srp-jobtuple-wrapper")]'
+
+# (column, XPath relative to the card, attribute or None for visible text)
+CARD_FIELDS = [
+    ("Job Title", './/a[contains(@class, "title")]', None),
+    ("Location", './/span[contains(@class, "locWdth")]', None),
+    ("Experience", './/span[contains(@class, "expwdth")]', None),
+    ("Description", './/span[contains(@class, "job-desc")]', None),
+    ("Job URL", './/a[contains(@class, "title")]', "href"),
+]
+
+EXTRACT_CARDS_JS = """
+const [cardXPath, fields] = arguments;
+const cards = document.evaluate(cardXPath, document, null,
+    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const rows = [];
+for (let i = 0; i < cards.snapshotLength; i++) {
+    const card = cards.snapshotItem(i);
+    const row = {};
+    for (const [name, xpath, attr] of fields) {
+        const node = document.evaluate(xpath, card, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (!node) {
+            row[name] = null;
+        } else if (attr) {
+            row[name] = (attr in node) ? node[attr] : node.getAttribute(attr);
+        } else {
+            row[name] = node.innerText;
+        }
+    }
+    rows.push(row);
+}
+return rows;
+"""
+
+def _clean_field(value, attr):
+    if value is None:
+        return "N/A"
+    return value if attr else value.strip()
+
+def extract_cards_elements(job_cards):
+    """Extract card fields with one find_element round trip per field"""
+    from selenium.webdriver.common.by import By
+    
+    records = []
+    for i, card in enumerate(job_cards):
+        record = {}
+        try:
+            for name, xpath, attr in CARD_FIELDS:
+                try:
+                    element = card.find_element(By.XPATH, xpath)
+                    value = element.get_attribute(attr) if attr else element.text
+                    record[name] = _clean_field(value, attr)
+                except:
+                    record[name] = "N/A"
+        except Exception as e:
+            log.warning("⚠️ Error extracting job %d: %s", i + 1, e)
+            continue
+        records.append(record)
+    return records
+
+def extract_cards_script(driver):
+    """Extract every card's fields in a single execute_script round trip"""
+    rows = driver.execute_script(EXTRACT_CARDS_JS, CARD_XPATH, CARD_FIELDS) or []
+    return [
+        {name: _clean_field(row.get(name), attr) for name, _, attr in CARD_FIELDS}
+        for row in rows
+    ]
+
+def get_driver_pool():
+    """Shared pool of warm Chrome drivers for this worker process"""
+    return get_pool(setup_chrome_driver)
+
+# ----------- Page Fetching -----------
+NAUKRI_BASE_URL = os.environ.get("NAUKRI_BASE_URL", "https://www.naukri.com")
+FETCH_BACKEND = os.environ.get("NAUKRI_FETCH_BACKEND", "http")
+
+def build_search_url(query, page, base_url=None):
+    base_url = (base_url or NAUKRI_BASE_URL).rstrip("/")
+    return f"{base_url}/{query.replace(' ', '-')}-jobs-{page}?k={query}"
+
+def _is_blocked(page_source):
+    page_source = page_source.lower()
+    return "blocked" in page_source or "captcha" in page_source
+
+def scrape_page_http(url):
+    """Fetch and parse one results page without a browser.
+
+    Returns ``(records, status)`` where status is "ok", "blocked" or "empty".
+    """
+    with span("fetch"):
+        page_html = fetch_page(url)
+    if _is_blocked(page_html):
+        return [], "blocked"
+    with span("extract"):
+        records = parse_cards(page_html, CARD_XPATH, CARD_FIELDS, base_url=url)
+    if not records:
+        return [], "empty"
+    return records, "ok"
+
+def scrape_page_selenium(driver, url, page, extraction="script"):
+    """Render one results page in Chrome and extract its cards.
+
+    Returns ``(records, status)`` where status is "ok", "blocked", "missing"
+    (cards never appeared) or "empty".
+    """
+    with span("fetch"):
+        driver.get(url)
+    
+    # Return as soon as cards render (or a block page shows up)
+    with span("wait"):
+        state = get_wait_policy().wait_for_cards(driver, CARD_XPATH, host_of(url), timeout=20)
+    if state == "blocked":
+        return [], "blocked"
+    if state == "missing":
+        log.warning("⚠️ No job cards found on page %d", page)
+        return [], "missing"
+    
+    from selenium.webdriver.common.by import By
+    
+    with span("extract"):
+        # Find job cards
+        job_cards = driver.find_elements(By.XPATH, CARD_XPATH)
+        log.info("📋 Found %d job cards on page %d", len(job_cards), page)
+        
+        if len(job_cards) == 0:
+            return [], "empty"
+        
+        # Extract job data
+        if extraction == "script":
+            return extract_cards_script(driver), "ok"
+        return extract_cards_elements(job_cards), "ok"
+
+def scrape_page(query, page, extraction="script", backend=None, base_url=None):
+    """Scrape one results page, falling back from HTTP to Chrome if needed.
+
+    Returns a dict with the page number, its records, the final status and
+    the backend that produced it.
+    """
+    backend = backend or FETCH_BACKEND
+    url = build_search_url(query, page, base_url)
+    log.info("🔍 Scraping page %d: %s", page, url)
     
-    wait = WebDriverWait(driver, 20)  # Increased timeout
+    status = None
+    records = []
+    weight = None
+    if backend == "http":
+        try:
+            records, status = scrape_page_http(url)
+            used = "http"
+        except Exception as e:
+            # Network errors, and bodies lxml cannot parse ("Document is empty")
+            log.warning("⚠️ HTTP fetch failed on page %d: %s", page, e)
+        if status != "ok":
+            log.info("↪️ Falling back to Selenium for page %d (%s)", page, status or "error")
+    
+    if status != "ok":
+        used = "selenium"
+        pool = get_driver_pool()
+        try:
+            with span("driver_acquire"):
+                driver = pool.acquire()
+        except DriverPoolError as e:
+            log.error("❌ Failed to setup Chrome driver: %s", e)
+            records, status, driver = [], "error", None
+        if driver is not None:
+            broken = False
+            try:
+                records, status = scrape_page_selenium(driver, url, page, extraction)
+                weight = page_weight(driver)
+            except Exception as e:
+                # A crashed browser is never handed out again
+                log.error("❌ Error on page %d: %s", page, e)
+                records, status, broken = [], "error", True
+            finally:
+                pool.release(driver, broken=broken)
+    
+    record_page(used, status, len(records))
+    if weight:
+        record_page_weight(weight["bytes"], weight["load_seconds"])
+        log.info("📦 Page %d: %d bytes over %d requests, DOM ready in %ss", page,
+                 weight["bytes"], weight["requests"], weight["load_seconds"])
+    get_wait_policy().record_outcome(host_of(url), status)
+    return {"page": page, "records": records, "status": status, "backend": used, "weight": weight}
+
+def iter_naukri_jobs(query, pages=1, extraction="script", backend=None, base_url=None,
+                     store=None, incremental=False, known_run=20, fetch_report=None, cancel=None):
+    """Yield scraped job records one by one as their pages arrive.
+
+    Pages are submitted to the shared crawl scheduler up front (in waves
+    when incremental) and consumed in page order, so the first page's cards
+    are yielded while later pages are still being fetched. Closing the
+    generator stops every page that has not started fetching yet (see
+    ``CrawlScheduler.submit``) and stores what was collected so far. Setting
+    ``cancel`` (a ``threading.Event``) does the same from another thread,
+    even while the current page is still loading. ``fetch_report``, if given, is a dict that is filled
+    with the backend summary described in ``get_naukri_jobs``.
+    """
+    backend = backend or FETCH_BACKEND
+    host = host_of(build_search_url(query, 1, base_url))
+    scheduler = get_scheduler()
+    wave = scheduler.max_workers if incremental and store is not None else pages
     job_data = []
+    page_backends = []
+    page_weights = []
+    seen = set()
+    known_streak = 0
+    futures = []
+    stop = threading.Event()
+    cancel = cancel or stop
     
     try:
-        for page in range(1, pages + 1):
-            url = f"https://www.naukri.com/{query.replace(' ', '-')}-jobs-{page}?k={query}"
-            print(f"\n🔍 Scraping page {page}: {url}")
+        for first in range(1, pages + 1, wave):
+            futures = [scheduler.submit(host, scrape_page, query, page, extraction, backend, base_url,
+                                        cancel=stop)
+                       for page in range(first, min(first + wave, pages + 1))]
             
-            try:
-                driver.get(url)
-                
-                # Wait for page to load completely
-                time.sleep(random.randint(5, 8))
-                
-                # Check if blocked or captcha
-                if "blocked" in driver.page_source.lower() or "captcha" in driver.page_source.lower():
-                    print("❌ Blocked or captcha detected")
-                    break
-                
-                # Wait for job cards to load
+            # Merge in page order; a blocked or empty page ends the crawl as before
+            for page, future in zip(range(first, pages + 1), futures):
+                while not wait([future], timeout=0.5).done and not cancel.is_set():
+                    pass
+                if cancel.is_set():
+                    log.info("⏹️ Crawl cancelled before page %d", page)
+                    return
                 try:
-                    wait.until(EC.presence_of_element_located((By.XPATH, '//div[contains(@class, "srp-jobtuple-wrapper")]')))
-                except:
-                    print(f"⚠️ No job cards found on page {page}")
+                    result = future.result()
+                except Exception as e:
+                    # One failing page is an "error" page, not the end of the crawl
+                    log.error("❌ Error on page %d: %s", page, e)
+                    get_wait_policy().record_outcome(host, "error")
                     continue
+                status = result["status"]
+                page_backends.append(result["backend"])
+                if result["weight"]:
+                    page_weights.append(dict(result["weight"], page=page))
                 
-                # Find job cards
-                job_cards = driver.find_elements(By.XPATH, '//div[contains(@class, "srp-jobtuple-wrapper")]')
-                print(f"📋 Found {len(job_cards)} job cards on page {page}")
-                
-                if len(job_cards) == 0:
-                    print("⚠️ No job cards found, possibly blocked")
-                    break
+                if status == "blocked":
+                    log.warning("❌ Blocked or captcha detected on page %d", page)
+                    return
+                if status == "empty":
+                    log.warning("⚠️ No job cards found on page %d, possibly blocked", page)
+                    return
+                if status != "ok":
+                    continue
                 
-                # Extract job data
-                for i, card in enumerate(job_cards):
-                    try:
-                        # Extract job title
-                        try:
-                            title = card.find_element(By.XPATH, './/a[contains(@class, "title")]').text.strip()
-                        except:
-                            title = "N/A"
-                        
-                        # Extract location
-                        try:
-                            location = card.find_element(By.XPATH, './/span[contains(@class, "locWdth")]').text.strip()
-                        except:
-                            location = "N/A"
-                        
-                        # Extract experience
-                        try:
-                            experience = card.find_element(By.XPATH, './/span[contains(@class, "expwdth")]').text.strip()
-                        except:
-                            experience = "N/A"
-                        
-                        # Extract description
-                        try:
-                            description = card.find_element(By.XPATH, './/span[contains(@class, "job-desc")]').text.strip()
-                        except:
-                            description = "N/A"
-                        
-                        # Extract job URL
-                        try:
-                            title_element = card.find_element(By.XPATH, './/a[contains(@class, "title")]')
-                            job_url = title_element.get_attribute('href')
-                        except:
-                            job_url = "N/A"
-                        
-                        # Only add if we have at least title and location
-                        if title != "N/A" and location != "N/A":
-                            job_data.append({
-                                "Job Title": title,
-                                "Location": location,
-                                "Experience": experience,
-                                "Description": description,
-                                "Job URL": job_url
-                            })
-                            print(f"✅ Extracted job {i+1}: {title[:50]}...")
-                        
-                    except Exception as e:
-                        print(f"⚠️ Error extracting job {i+1}: {e}")
+                records = result["records"]
+                known = store.known_keys(job_key(r) for r in records) if incremental and store else set()
+                for i, record in enumerate(records):
+                    # Only add if we have at least title and location
+                    if record["Job Title"] == "N/A" or record["Location"] == "N/A":
                         continue
-                
-                # Random delay between pages
-                if page < pages:
-                    delay = random.randint(8, 15)
-                    print(f"⏱️ Waiting {delay} seconds before next page...")
-                    time.sleep(delay)
+                    key = job_key(record)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    job_data.append(record)
+                    log.debug("✅ Extracted job %d: %.50s...", i + 1, record["Job Title"])
+                    yield record
                     
-            except Exception as e:
-                print(f"❌ Error on page {page}: {e}")
-                continue
-                
-    except KeyboardInterrupt:
-        print("⏹️ Scraping interrupted by user")
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+                    known_streak = known_streak + 1 if key in known else 0
+                    if incremental and known_streak >= known_run:
+                        log.info("⏹️ %d already-known postings in a row on page %d, stopping",
+                                 known_run, page)
+                        return
     finally:
-        driver.quit()
-        print(f"🔒 Browser closed")
+        # Pages still waiting for their host slot see the event and never fetch
+        stop.set()
+        for future in futures:
+            future.cancel()
+        
+        if store is not None and job_data:
+            new = store.upsert(job_data, role=query)
+            log.info("💾 Stored %d postings (%d new)", len(job_data), new)
+        
+        fallbacks = page_backends.count("selenium") if backend == "http" else 0
+        if fetch_report is not None:
+            fetch_report.update({
+                "backend": backend,
+                "page_backends": page_backends,
+                "fallbacks": fallbacks,
+                "fallback_rate": fallbacks / len(page_backends) if page_backends else 0.0,
+                "page_weights": page_weights,
+            })
+        log.info("📊 Total jobs scraped: %d (backend: %s, Selenium fallbacks: %d/%d)",
+                 len(job_data), backend, fallbacks, len(page_backends))
+        log.info("⏳ Waits applied (recent history): %s", ", ".join(
+            f"{kind} {entry['count']}x {entry['total']:.1f}s (max {entry['max']:.1f}s)"
+            for kind, entry in get_wait_policy().summary().items()) or "none")
+
+def get_naukri_jobs(query, pages=1, extraction="script", backend=None, base_url=None,
+                    store=None, incremental=False, known_run=20):
+    """Scrape Naukri jobs with proper error handling for Render
+
+    Pages are fetched concurrently through the shared crawl scheduler, which
+    caps total concurrency and spaces requests to the same host, then merged
+    back in page order. A posting seen on more than one page is kept once.
+
+    ``backend="http"`` fetches pages with a pooled requests session and only
+    falls back to Chrome when a page has no cards or looks like a captcha;
+    ``backend="selenium"`` always renders in Chrome. ``extraction="script"``
+    pulls every card in one ``execute_script`` round trip;
+    ``extraction="elements"`` uses per-field ``find_element`` calls.
+
+    With a ``store`` (see ``job_store.JobStore``) the scraped postings are
+    upserted into it. ``incremental=True`` additionally fetches pages in
+    scheduler-sized waves and stops paging once ``known_run`` consecutive
+    postings are already in the store.
+
+    The frame uses the compact schema from ``job_schema``. The backend used
+    for each page, the fallback rate and, for pages rendered in Chrome, the
+    bytes transferred and DOM-ready time (see ``chrome_profile.page_weight``)
+    are attached to it as ``df.attrs["fetch_report"]``. ``iter_naukri_jobs`` is the streaming form.
+    """
+    import pandas as pd
     
-    print(f"\n📊 Total jobs scraped: {len(job_data)}")
-    return pd.DataFrame(job_data)
+    fetch_report = {}
+    job_data = []
+    try:
+        for record in iter_naukri_jobs(query, pages, extraction, backend, base_url,
+                                       store, incremental, known_run, fetch_report):
+            job_data.append(record)
+    except KeyboardInterrupt:
+        log.warning("⏹️ Scraping interrupted by user")
+    df = compact_jobs(pd.DataFrame(job_data))
+    df.attrs["fetch_report"] = fetch_report
+    return df
 
 def test_chrome_setup():
     """Test function to verify Chrome setup"""
+    from selenium.webdriver.common.by import By
+    
     print("🧪 Testing Chrome setup...")
     driver = setup_chrome_driver()
     
@@ -182,7 +415,49 @@ def test_chrome_setup():
         print("❌ Chrome driver setup failed")
         return False
 
+def test_extraction_parity(fixture="fixtures/naukri_search_page.html"):
+    """Check that script and element extraction agree on a saved results page"""
+    import pandas as pd
+    from selenium.webdriver.common.by import By
+    
+    print(f"🧪 Comparing extraction modes on {fixture}...")
+    driver = setup_chrome_driver()
+    if not driver:
+        print("❌ Chrome driver setup failed")
+        return False
+    
+    try:
+        driver.get(f"file://{os.path.abspath(fixture)}")
+        job_cards = driver.find_elements(By.XPATH, CARD_XPATH)
+        by_elements = pd.DataFrame(extract_cards_elements(job_cards))
+        by_script = pd.DataFrame(extract_cards_script(driver))
+        if by_elements.equals(by_script):
+            print(f"✅ Extraction modes match ({len(by_script)} cards)")
+            return True
+        print("❌ Extraction modes differ:")
+        print(by_elements.compare(by_script))
+        return False
+    finally:
+        driver.quit()
+
+def test_http_backend(fixture_dir="fixtures"):
+    """Scrape a recorded results page served from a local HTTP server"""
+    from fixture_server import serve_fixtures
+    
+    print(f"🧪 Testing HTTP backend against {fixture_dir}...")
+    with serve_fixtures(fixture_dir) as base_url:
+        df = get_naukri_jobs("Data Scientist", pages=1, backend="http", base_url=base_url)
+    
+    report = df.attrs.get("fetch_report", {})
+    if df.empty or report.get("fallbacks"):
+        print(f"❌ HTTP backend test failed: {report}")
+        return False
+    print(f"✅ HTTP backend parsed {len(df)} jobs without Selenium")
+    return True
+
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(), format="%(message)s")
+    
     # Test Chrome setup first
     if not test_chrome_setup():
         print("❌ Chrome setup test failed. Fix Chrome installation first.")
@@ -0,0 +1,200 @@
+import os
+import time
+import logging
+import threading
+import multiprocessing
+import weakref
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from metrics import observe
+
+log = logging.getLogger(__name__)
+
+
+class RenderTimeout(Exception):
+    """Raised when a chart did not finish rendering within the timeout"""
+
+
+def _init_worker():
+    # Pay for the Agg backend and chart imports once per worker, not per chart
+    import matplotlib
+    matplotlib.use("Agg")
+    import charts  # noqa: F401
+
+
+def _render(kind, location_counts, job_title, output_file, dpi):
+    from charts import CHART_RENDERERS
+
+    start = time.perf_counter()
+    result = CHART_RENDERERS[kind](location_counts, job_title, output_file, dpi)
+    return result, round(time.perf_counter() - start, 3)
+
+
+class RenderPool:
+    """Renders charts in worker processes so they never hold this process's GIL.
+
+    Jobs carry only ``{location: count}`` mappings. Each render is bounded by
+    ``timeout`` seconds; after a timeout new renders go to fresh workers and
+    the old ones are killed once their other renders finish (see
+    ``_retire``). A pool broken by a dying worker is replaced on next use.
+    Every call returns a timing entry per chart: time spent rendering in the
+    worker and wall time including queueing and transfer.
+    """
+
+    def __init__(self, workers=2, timeout=60):
+        self.workers = workers
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._retired = weakref.WeakSet()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._executor
+
+    def _reset(self, broken):
+        """Replace ``broken`` (a pool a worker died in) if it is still the current one"""
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _retire(self, executor, hung):
+        """Send no more work to ``executor`` and kill its processes once every
+        other render on it has finished.
+
+        A hung render cannot be cancelled, and killing any one worker breaks
+        the whole pool, so renders that other threads have running on the
+        same pool are allowed to finish first.
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+            if executor in self._retired:
+                return
+            self._retired.add(executor)
+            others = [future for future in self._inflight.get(executor, ()) if future is not hung]
+
+        def stop():
+            wait(others, timeout=self.timeout)
+            for process in list(getattr(executor, "_processes", {}).values()):
+                process.terminate()
+            executor.shutdown(wait=False, cancel_futures=True)
+            with self._lock:
+                self._inflight.pop(executor, None)
+
+        threading.Thread(target=stop, name="render-retire", daemon=True).start()
+
+    def _track(self, executor, future):
+        with self._lock:
+            self._inflight.setdefault(executor, set()).add(future)
+
+        def untrack(done):
+            with self._lock:
+                self._inflight.get(executor, set()).discard(done)
+        future.add_done_callback(untrack)
+        return executor, future
+
+    def _submit(self, job):
+        """Submit one job as ``(executor, future)``, replacing a broken executor once"""
+        kind, location_counts, job_title, output_file, dpi = job
+        # Workers keep the cwd they were spawned with, so hand them absolute paths
+        args = (_render, kind, location_counts, job_title, os.path.abspath(output_file), dpi)
+        executor = self._get_executor()
+        try:
+            return self._track(executor, executor.submit(*args))
+        except BrokenProcessPool:
+            log.warning("⚠️ Render pool broken, starting new workers")
+            self._reset(executor)
+            executor = self._get_executor()
+            return self._track(executor, executor.submit(*args))
+
+    def render_many(self, jobs):
+        """Render ``(kind, location_counts, job_title, output_file, dpi)`` jobs concurrently"""
+        started = time.perf_counter()
+        submitted = []
+        for job in jobs:
+            entry = {"kind": job[0], "file": None, "status": "ok"}
+            executor = future = None
+            try:
+                executor, future = self._submit(job)
+            except BrokenProcessPool as e:
+                entry["status"] = "failed"
+                entry["error"] = f"render pool unavailable: {e}"
+            submitted.append((entry, job[3], executor, future))
+
+        timings = []
+        deadline = started + self.timeout
+        for entry, output_file, executor, future in submitted:
+            if future is not None:
+                try:
+                    result, entry["render_seconds"] = future.result(
+                        timeout=max(0.0, deadline - time.perf_counter()))
+                    if result is None:
+                        entry["status"] = "failed"
+                    else:
+                        entry["file"] = output_file
+                except FutureTimeout:
+                    entry["status"] = "timeout"
+                    self._retire(executor, future)
+                except BrokenProcessPool as e:
+                    entry["status"] = "failed"
+                    with self._lock:
+                        retired = executor in self._retired
+                    if retired:
+                        # Collateral of another render's timeout, not a crash
+                        entry["error"] = "render pool restarted after another chart timed out"
+                    else:
+                        # A worker died (OOM kill, segfault); the next call gets new workers
+                        entry["error"] = f"render worker crashed: {e}"
+                        self._reset(executor)
+                except Exception as e:
+                    entry["status"] = "failed"
+                    entry["error"] = str(e)
+            entry["wall_seconds"] = round(time.perf_counter() - started, 3)
+            if "render_seconds" in entry:
+                observe("render", entry["render_seconds"])
+            timings.append(entry)
+
+        if log.isEnabledFor(logging.INFO):
+            log.info("⏱️ Render timings: %s", ", ".join(
+                f"{t['kind']} {t.get('render_seconds', 0):.2f}s ({t['status']})" for t in timings))
+        return timings
+
+    def render(self, kind, location_counts, job_title, output_file, dpi=300):
+        """Render a single chart; raises RenderTimeout if it takes too long"""
+        timing = self.render_many([(kind, location_counts, job_title, output_file, dpi)])[0]
+        if timing["status"] == "timeout":
+            raise RenderTimeout(f"{kind} did not render within {self.timeout}s")
+        return timing
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool():
+    """Return the process-wide render pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = RenderPool(
+                workers=int(os.environ.get("RENDER_WORKERS", 2)),
+                timeout=float(os.environ.get("RENDER_TIMEOUT", 60)),
+            )
+        return _pool
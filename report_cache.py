@@ -0,0 +1,182 @@
+import os
+import re
+import time
+import fcntl
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+
+from metrics import CACHE_EVICTIONS, CACHE_REQUESTS
+from report_jobs import normalize_role
+
+
+def _artifact(name):
+    """Artifact label for an entry suffix or file name"""
+    if name.endswith(".locations.json"):
+        return "locations"
+    if name.endswith(".html") and not name.endswith(".map.html"):
+        return "report"
+    return "chart"
+
+
+class ReportCache:
+    """On-disk cache of generated report artifacts.
+
+    Entries are plain files in ``directory`` named by a key built from the
+    normalized role and page count. Entries older than ``ttl`` seconds are
+    stale; beyond ``max_entries`` files or ``max_bytes`` total the least
+    recently used entries are evicted. Writes go to a temp file that is
+    renamed into place, and ``lock(key)`` serialises regeneration of a key
+    across worker processes. Lock files are removed with the last entry
+    they guard.
+    """
+
+    def __init__(self, directory="report_cache", ttl=6 * 3600, max_entries=100,
+                 max_bytes=200 * 1024 * 1024):
+        # Absolute, because send_file resolves relative paths against the app root
+        self.directory = os.path.abspath(directory)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    # ----------- Keys -----------
+    @staticmethod
+    def key(role, pages):
+        role = normalize_role(role)
+        slug = re.sub(r"[^a-z0-9]+", "_", role).strip("_")[:60] or "role"
+        digest = hashlib.sha1(f"{role}|{pages}".encode("utf-8")).hexdigest()[:10]
+        return f"{slug}__p{pages}__{digest}"
+
+    def path(self, key, suffix=".html"):
+        return os.path.join(self.directory, key + suffix)
+
+    # ----------- Lookup -----------
+    def get(self, key, suffix=".html"):
+        """Return the entry's path if it exists and is fresh, else None"""
+        path = self.path(key, suffix)
+        try:
+            mtime = os.stat(path).st_mtime
+        except FileNotFoundError:
+            self._count("misses", suffix)
+            return None
+
+        if time.time() - mtime > self.ttl:
+            self._remove(path)
+            self._count("misses", suffix)
+            return None
+
+        # Touch the access time only; mtime still drives the TTL
+        os.utime(path, (time.time(), mtime))
+        self._count("hits", suffix)
+        return path
+
+    # ----------- Writes -----------
+    @contextmanager
+    def writing(self, key, suffix=".html"):
+        """Yield a temp path to write to; it replaces the entry on success"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=suffix)
+        os.close(fd)
+        try:
+            yield tmp_path
+            if os.path.getsize(tmp_path) > 0:
+                os.replace(tmp_path, self.path(key, suffix))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.evict()
+
+    @contextmanager
+    def lock(self, key):
+        """Exclusive cross-process lock for regenerating ``key``"""
+        path = self.path(key, ".lock")
+        while True:
+            lock_file = open(path, "a")
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            # Eviction may have unlinked the file while we waited; lock the new one then
+            try:
+                if os.stat(path).st_ino == os.fstat(lock_file.fileno()).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            lock_file.close()
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+    # ----------- Eviction -----------
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.startswith(".tmp-") or name.endswith(".lock"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_atime, st.st_mtime, st.st_size, path))
+        return entries
+
+    def evict(self):
+        """Drop expired entries, then least recently used ones over the limits"""
+        now = time.time()
+        live = []
+        for atime, mtime, size, path in self._entries():
+            if now - mtime > self.ttl:
+                self._remove(path)
+            else:
+                live.append((atime, size, path))
+
+        live.sort()
+        total = sum(size for _, size, _ in live)
+        while live and (len(live) > self.max_entries or total > self.max_bytes):
+            _, size, path = live.pop(0)
+            self._remove(path)
+            total -= size
+
+        self._remove_stale_locks({os.path.basename(path) for _, _, path in live})
+
+    def _remove_stale_locks(self, live_names):
+        """Unlink lock files whose entries are all gone and that nobody holds"""
+        for name in os.listdir(self.directory):
+            if not name.endswith(".lock"):
+                continue
+            base = name[:-len(".lock")]
+            if any(entry.startswith(base) for entry in live_names):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, "a") as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    os.remove(path)
+            except (BlockingIOError, FileNotFoundError):
+                continue
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        self._count("evictions")
+        CACHE_EVICTIONS.labels(_artifact(path)).inc()
+
+    def _count(self, name, suffix=None):
+        with self._lock:
+            self._stats[name] += 1
+        if suffix is not None:
+            CACHE_REQUESTS.labels(_artifact(suffix), "hit" if name == "hits" else "miss").inc()
+
+    def stats(self):
+        entries = self._entries()
+        with self._lock:
+            stats = dict(self._stats)
+        stats["entries"] = len(entries)
+        stats["bytes"] = sum(size for _, _, size, _ in entries)
+        return stats
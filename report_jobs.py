@@ -0,0 +1,161 @@
+import time
+import uuid
+import threading
+import contextvars
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from metrics import current_timings
+
+
+def normalize_role(role):
+    """Canonical form of a role query: case and whitespace insensitive"""
+    return " ".join(role.split()).lower()
+
+
+class QueueFull(Exception):
+    """Raised when too many report jobs are already waiting or running"""
+
+
+class ReportJob:
+    def __init__(self, key, role, pages):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.role = role
+        self.pages = pages
+        self.status = "queued"
+        self.progress = "queued"
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.timings = current_timings()
+
+    @property
+    def done(self):
+        return self.status in ("done", "failed")
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "role": self.role,
+            "pages": self.pages,
+            "status": self.status,
+            "progress": self.progress,
+            "error": self.error,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "timings": self.timings.to_dict() if self.timings is not None else None,
+        }
+
+
+class ReportJobManager:
+    """Runs report generation in the background with single-flight dedup.
+
+    ``run(role, pages, progress)`` does the actual work and returns a truthy
+    result on success; ``progress`` is a callback taking a short status
+    string. Concurrent submissions for the same normalized role and page
+    count share one job. A job runs in a copy of the submitting context, so
+    a per-request timing breakdown (see ``metrics.collect_timings``) follows
+    it and is reported by ``to_dict``. At most ``max_workers`` jobs run at once and at
+    most ``max_queue`` may be pending before ``submit`` raises QueueFull.
+    """
+
+    def __init__(self, run, max_workers=2, max_queue=20, keep_finished=200):
+        self.run = run
+        self.max_queue = max_queue
+        self.keep_finished = keep_finished
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report")
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+        self._inflight = {}
+        self._batches = OrderedDict()
+
+    def submit(self, role, pages):
+        """Return ``(job, created)``; joins the in-flight job for the same key"""
+        with self._lock:
+            return self._submit_locked(role, pages)
+
+    def _submit_locked(self, role, pages):
+        key = (normalize_role(role), pages)
+        job = self._inflight.get(key)
+        if job is not None:
+            return job, False
+        if len(self._inflight) >= self.max_queue:
+            raise QueueFull(f"{len(self._inflight)} report jobs already pending")
+
+        job = ReportJob(key, role, pages)
+        self._jobs[job.id] = job
+        self._inflight[key] = job
+        self._trim()
+        self._executor.submit(contextvars.copy_context().run, self._execute, job)
+        return job, True
+
+    def submit_batch(self, requests):
+        """Submit ``(role, pages)`` pairs as one batch; returns ``(batch_id, jobs)``.
+
+        Each role is an ordinary job, deduplicated against in-flight ones.
+        The whole batch is rejected with QueueFull if it does not fit.
+        """
+        keys = {(normalize_role(role), pages) for role, pages in requests}
+        batch_id = uuid.uuid4().hex
+        # Check and submit under one lock so a batch is queued whole or not at all
+        with self._lock:
+            new = len(keys - self._inflight.keys())
+            if len(self._inflight) + new > self.max_queue:
+                raise QueueFull(f"{len(self._inflight)} report jobs already pending, "
+                                f"batch needs {new} more")
+            jobs = [self._submit_locked(role, pages)[0] for role, pages in requests]
+            self._batches[batch_id] = [job.id for job in jobs]
+            while len(self._batches) > self.keep_finished:
+                self._batches.popitem(last=False)
+        return batch_id, jobs
+
+    def get_batch(self, batch_id):
+        """Jobs of a batch in submission order, or None if the batch is unknown"""
+        with self._lock:
+            job_ids = self._batches.get(batch_id)
+            if job_ids is None:
+                return None
+            return [self._jobs.get(job_id) for job_id in job_ids]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def pending(self):
+        with self._lock:
+            return len(self._inflight)
+
+    def _execute(self, job):
+        job.status = job.progress = "running"
+        job.started = time.time()
+
+        def progress(message):
+            job.progress = message
+
+        try:
+            job.result = self.run(job.role, job.pages, progress)
+            if job.result:
+                job.status = job.progress = "done"
+            else:
+                job.status = "failed"
+                job.error = "Failed to scrape jobs"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished = time.time()
+            with self._lock:
+                self._inflight.pop(job.key, None)
+
+    def _trim(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[:max(0, len(finished) - self.keep_finished)]:
+            del self._jobs[job_id]
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
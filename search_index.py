@@ -0,0 +1,299 @@
+"""In-process inverted index for full-text search over scraped postings.
+
+Titles and descriptions are tokenized into per-term posting lists of doc
+ids plus term frequencies, held in ``array`` buffers (4 bytes per id, 1 per
+frequency). Doc ids only ever grow, so the lists stay sorted as postings
+are appended. Normalized locations get id-only posting lists of their own.
+
+A query intersects its lists, starting from the shortest one with binary
+searches, then ranks the matches with BM25. It works on zero-copy numpy
+views of the buffers, so it never scans the postings themselves. Removal
+marks a doc dead, and dead ids are compacted out of the lists once they
+pile up.
+
+Each worker process keeps its own index. ``sync`` brings it up to date
+with the shared job store from a rowid / ``last_seen`` high-water mark, so
+postings stored by any worker become searchable on that worker's next
+search.
+"""
+import re
+import math
+import threading
+from array import array
+from collections import Counter
+
+from gazetteer import GAZETTEER
+from job_store import get_job_store, job_key
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[+#]+|\.[a-z0-9]+)*")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in is of on or our the to we will with you your".split())
+
+TITLE_WEIGHT = 3
+
+
+def tokenize(text):
+    """Lower-cased search terms, keeping tokens like "c++", "c#" and "node.js" whole"""
+    return [token for token in _TOKEN.findall(str(text or "").lower()) if token not in STOPWORDS]
+
+
+class _Postings:
+    __slots__ = ("ids", "tfs")
+
+    def __init__(self):
+        self.ids = array("I")
+        self.tfs = array("B")
+
+
+class SearchIndex:
+    """Inverted index keyed by job key (see ``job_store.job_key``).
+
+    ``add`` indexes or re-indexes a posting and ``remove`` drops it, both in
+    time proportional to the posting's own terms. ``search`` returns
+    ``(key, score)`` pairs, best first. ``normalize`` turns one raw
+    location into its canonical name.
+    """
+
+    def __init__(self, normalize=None, k1=1.2, b=0.75):
+        self.normalize = normalize or GAZETTEER.normalize
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.RLock()
+        self._ids = {}
+        self._keys = []
+        self._alive = bytearray()
+        self._lengths = array("H")
+        self._terms = {}
+        self._locations = {}
+        self._live = 0
+        self._dead = 0
+        self._total_length = 0
+
+        self._sync_lock = threading.Lock()
+        self._synced = None
+        self._rowid = 0
+        self._last_seen = 0
+
+    def __len__(self):
+        return self._live
+
+    # ----------- Updates -----------
+    def add(self, key, title, description="", location=""):
+        counts = Counter(tokenize(description))
+        for token in tokenize(title):
+            counts[token] += TITLE_WEIGHT
+        locations = {self.normalize(raw.strip()) for raw in str(location or "").split(",") if raw.strip()}
+        length = min(sum(counts.values()), 0xFFFF)
+
+        with self._lock:
+            if key in self._ids:
+                self._remove(key)
+            doc = len(self._keys)
+            for term, count in counts.items():
+                postings = self._terms.get(term)
+                if postings is None:
+                    postings = self._terms[term] = _Postings()
+                postings.ids.append(doc)
+                postings.tfs.append(min(count, 0xFF))
+            for name in locations:
+                self._locations.setdefault(name, array("I")).append(doc)
+
+            self._ids[key] = doc
+            self._keys.append(key)
+            self._alive.append(1)
+            self._lengths.append(length)
+            self._live += 1
+            self._total_length += length
+
+    def add_records(self, records):
+        """Index scraped records under their ``job_store.job_key``"""
+        for record in records:
+            self.add(job_key(record), record.get("Job Title"), record.get("Description"),
+                     record.get("Location"))
+
+    def sync(self, store, wait=True):
+        """Index postings stored or refreshed since the last sync; returns how many.
+
+        Cheap when nothing changed (one ``store.version()`` query). With
+        ``wait=False`` it returns None at once if another thread is already
+        syncing, so searches keep using the current contents meanwhile.
+        A refresh committed by another process with an older ``last_seen``
+        than one already synced is missed, but new postings never are
+        (they get fresh rowids).
+        """
+        if not self._sync_lock.acquire(blocking=wait):
+            return None
+        try:
+            version = store.version()
+            if version == self._synced:
+                return 0
+            count = 0
+            for rowid, key, job in store.changes_since(self._rowid, self._last_seen):
+                self.add(key, job["title"], job["description"], job["location"])
+                self._rowid = max(self._rowid, rowid)
+                self._last_seen = max(self._last_seen, job["last_seen"])
+                count += 1
+            self._synced = version
+            return count
+        finally:
+            self._sync_lock.release()
+
+    def remove(self, key):
+        """Drop a posting; returns False if it was not indexed"""
+        with self._lock:
+            return self._remove(key)
+
+    def _remove(self, key):
+        doc = self._ids.pop(key, None)
+        if doc is None:
+            return False
+        self._alive[doc] = 0
+        self._keys[doc] = None
+        self._live -= 1
+        self._dead += 1
+        self._total_length -= self._lengths[doc]
+        if self._dead > max(1000, self._live):
+            self._compact()
+        return True
+
+    def _compact(self):
+        """Filter dead doc ids out of every posting list"""
+        import numpy as np
+
+        alive = np.frombuffer(self._alive, dtype=np.uint8).astype(bool)
+        for term in list(self._terms):
+            postings = self._terms[term]
+            ids = np.frombuffer(postings.ids, dtype=np.uint32)
+            keep = alive[ids]
+            if keep.all():
+                continue
+            if not keep.any():
+                del self._terms[term]
+                continue
+            compacted = _Postings()
+            compacted.ids.frombytes(ids[keep].tobytes())
+            compacted.tfs.frombytes(np.frombuffer(postings.tfs, dtype=np.uint8)[keep].tobytes())
+            self._terms[term] = compacted
+        for name in list(self._locations):
+            ids = np.frombuffer(self._locations[name], dtype=np.uint32)
+            kept = ids[alive[ids]]
+            if len(kept):
+                compacted = array("I")
+                compacted.frombytes(kept.tobytes())
+                self._locations[name] = compacted
+            else:
+                del self._locations[name]
+        self._dead = 0
+
+    # ----------- Queries -----------
+    def search(self, query, location=None, limit=20):
+        """Postings matching every query term (and ``location``), best first.
+
+        ``location`` is normalized like scraped locations. Without query
+        terms the newest postings at ``location`` are returned.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        location = self.normalize(location) if location else None
+        if not terms and not location:
+            return []
+        with self._lock:
+            # Buffer views must not outlive the lock: appends resize the arrays
+            return self._search(terms, location, limit)
+
+    def _search(self, terms, location, limit):
+        import numpy as np
+
+        lists = []
+        for term in terms:
+            postings = self._terms.get(term)
+            if postings is None:
+                return []
+            lists.append(postings)
+        location_ids = None
+        if location:
+            if location not in self._locations:
+                return []
+            location_ids = np.frombuffer(self._locations[location], dtype=np.uint32)
+
+        alive = np.frombuffer(self._alive, dtype=np.uint8)
+        if not lists:
+            # Location only: newest first
+            docs = location_ids[alive[location_ids] == 1][::-1][:limit]
+            return [(self._keys[doc], 0.0) for doc in docs.tolist()]
+
+        lists.sort(key=lambda postings: len(postings.ids))
+        candidates = np.frombuffer(lists[0].ids, dtype=np.uint32)
+        others = [np.frombuffer(postings.ids, dtype=np.uint32) for postings in lists[1:]]
+        if location_ids is not None:
+            others.append(location_ids)
+        for ids in sorted(others, key=len):
+            candidates = _intersect(candidates, ids)
+            if not len(candidates):
+                return []
+        candidates = candidates[alive[candidates] == 1]
+        if not len(candidates):
+            return []
+
+        # BM25 over the surviving candidates
+        lengths = np.frombuffer(self._lengths, dtype=np.uint16)[candidates]
+        norm = self.k1 * (1 - self.b + self.b * lengths / max(self._total_length / max(self._live, 1), 1))
+        scores = np.zeros(len(candidates))
+        for postings in lists:
+            ids = np.frombuffer(postings.ids, dtype=np.uint32)
+            tf = np.frombuffer(postings.tfs, dtype=np.uint8)[np.searchsorted(ids, candidates)]
+            idf = math.log(1 + (self._live - len(ids) + 0.5) / (len(ids) + 0.5))
+            scores += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        if len(candidates) > limit:
+            top = np.argpartition(-scores, limit)[:limit]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._keys[doc], round(score, 4))
+                for doc, score in zip(candidates[top].tolist(), scores[top].tolist())]
+
+    def stats(self):
+        with self._lock:
+            postings = sum(len(p.ids) for p in self._terms.values())
+            return {
+                "documents": self._live,
+                "terms": len(self._terms),
+                "locations": len(self._locations),
+                "postings": postings,
+                "posting_bytes": postings * 5 + sum(len(ids) * 4 for ids in self._locations.values()),
+            }
+
+
+def _intersect(candidates, ids):
+    """Members of sorted ``candidates`` also in sorted ``ids``, by binary search"""
+    import numpy as np
+
+    if not len(ids):
+        return candidates[:0]
+    positions = np.searchsorted(ids, candidates)
+    positions[positions == len(ids)] = len(ids) - 1
+    return candidates[ids[positions] == candidates]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_search_index(normalize=None):
+    """Return this process's index, creating it empty on first use (see ``sync``)"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SearchIndex(normalize)
+        return _index
+
+
+def warm_search_index(normalize=None):
+    """Load the index from the job store in a background thread, off the request path"""
+    index = get_search_index(normalize)
+    thread = threading.Thread(target=index.sync, args=(get_job_store(),),
+                              name="search-warm", daemon=True)
+    thread.start()
+    return thread
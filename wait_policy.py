@@ -0,0 +1,160 @@
+import os
+import time
+import random
+import threading
+from collections import deque
+
+from metrics import observe
+
+# Returns "cards" once a card is in the DOM, "blocked" for a block/captcha page
+READY_STATE_JS = """
+const cardXPath = arguments[0];
+const card = document.evaluate(cardXPath, document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (card) return "cards";
+const source = document.documentElement.innerHTML.toLowerCase();
+if (source.includes("captcha") || source.includes("blocked")) return "blocked";
+return null;
+"""
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, up to ``burst`` saved"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it is available; returns seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class WaitPolicy:
+    """Decides how long the scraper waits, and records what it actually waited.
+
+    * Politeness: a per-host token bucket paces request starts.
+    * Render: Selenium pages return as soon as the first card is in the DOM
+      instead of sleeping a fixed time.
+    * Backoff: only after a host answers with a block/captcha, an empty page
+      or an error, exponentially growing with consecutive failures and reset
+      by the next success.
+
+    Politeness and backoff waits are exported as the "politeness" and
+    "backoff" stages of ``pipeline_stage_seconds`` (the render wait is the
+    scraper's "wait" span), so they also show up in per-request timings.
+    """
+
+    FAILURES = ("blocked", "empty", "missing", "error")
+
+    def __init__(self, host_rate=0.5, host_burst=1, backoff_base=4.0, backoff_max=60.0,
+                 poll_interval=0.25, history=1000):
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._failures = {}
+        self.waits = deque(maxlen=history)
+
+    # ----------- Politeness / Backoff -----------
+    def before_fetch(self, host):
+        """Block until ``host`` may be fetched again"""
+        with self._lock:
+            bucket = self._buckets.setdefault(host, TokenBucket(self.host_rate, self.host_burst))
+        waited = bucket.acquire()
+        observe("politeness", waited)
+        self._record(host, "politeness", waited)
+
+        delay = self.backoff_delay(host)
+        if delay:
+            time.sleep(delay)
+            observe("backoff", delay)
+            self._record(host, "backoff", delay)
+
+    def backoff_delay(self, host):
+        with self._lock:
+            failures = self._failures.get(host, 0)
+        if not failures:
+            return 0.0
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (failures - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def record_outcome(self, host, status):
+        """Feed a page status back so later fetches back off or recover"""
+        with self._lock:
+            if status in self.FAILURES:
+                self._failures[host] = self._failures.get(host, 0) + 1
+            else:
+                self._failures.pop(host, None)
+
+    # ----------- Render Wait -----------
+    def wait_for_cards(self, driver, card_xpath, host, timeout=20):
+        """Poll until cards render or a block page shows up.
+
+        Returns "cards", "blocked" or "missing" (timed out).
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        start = time.monotonic()
+        try:
+            state = WebDriverWait(driver, timeout, poll_frequency=self.poll_interval).until(
+                lambda d: d.execute_script(READY_STATE_JS, card_xpath))
+        except TimeoutException:
+            state = "missing"
+        self._record(host, "render", time.monotonic() - start)
+        return state
+
+    # ----------- Reporting -----------
+    def _record(self, host, kind, seconds):
+        if seconds > 0:
+            self.waits.append({"host": host, "kind": kind, "seconds": round(seconds, 3),
+                               "at": time.time()})
+
+    def summary(self):
+        """Count, total, mean and max of the recorded waits per kind"""
+        summary = {}
+        for wait in list(self.waits):
+            entry = summary.setdefault(wait["kind"], {"count": 0, "total": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["total"] += wait["seconds"]
+            entry["max"] = max(entry["max"], wait["seconds"])
+        for entry in summary.values():
+            entry["mean"] = entry["total"] / entry["count"]
+        return summary
+
+
+_policy = None
+_policy_lock = threading.Lock()
+
+
+def get_wait_policy():
+    """Return the process-wide wait policy, creating it on first use"""
+    global _policy
+    with _policy_lock:
+        if _policy is None:
+            _policy = WaitPolicy(
+                host_rate=1.0 / float(os.environ.get("CRAWL_HOST_INTERVAL", 2.0)),
+                host_burst=int(os.environ.get("CRAWL_HOST_BURST", 1)),
+                backoff_base=float(os.environ.get("CRAWL_BACKOFF_BASE", 4.0)),
+                backoff_max=float(os.environ.get("CRAWL_BACKOFF_MAX", 60.0)),
+            )
+        return _policy